@@ -4,9 +4,13 @@ Provides secure password hashing and verification using the Argon2id
 algorithm, which is memory-hard and side-channel resistant.
 """
 
+from functools import lru_cache
+
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
+from backend.app.config import get_settings
+
 # Use library defaults (secure parameters)
 ph = PasswordHasher()
 
@@ -23,9 +27,26 @@ def hash_password(password: str) -> str:
     return ph.hash(password)
 
 
+def _verify_password(password: str, password_hash: str) -> bool:
+    """Verify password against argon2id hash without caching."""
+    try:
+        ph.verify(password_hash, password)
+        return True
+    except VerifyMismatchError:
+        return False
+
+
+# Bounded memo of recent (password, hash) results
+_verify_password_cached = lru_cache(maxsize=8)(_verify_password)
+
+
 def verify_password(password: str, password_hash: str) -> bool:
     """Verify password against argon2id hash.
 
+    When the ``password_verify_cache`` setting is enabled, repeated
+    verifications of the same (password, hash) pair reuse the earlier
+    result instead of re-running the argon2id KDF.
+
     Args:
         password: Plaintext password to verify.
         password_hash: Argon2id hash to verify against.
@@ -33,11 +54,9 @@ def verify_password(password: str, password_hash: str) -> bool:
     Returns:
         True if password matches, False otherwise.
     """
-    try:
-        ph.verify(password_hash, password)
-        return True
-    except VerifyMismatchError:
-        return False
+    if get_settings().password_verify_cache:
+        return _verify_password_cached(password, password_hash)
+    return _verify_password(password, password_hash)
 
 
 def validate_password_complexity(password: str) -> tuple[bool, str]:
@@ -54,6 +54,9 @@ class Settings(BaseSettings):
     secret_key: str  # JWT signing key (REQUIRED - no default for security)
     database_url: str = "sqlite+pysqlite:///./app.db"
     daemon_socket_path: str = "/tmp/encryptor-sim-daemon.sock"
+    # Memoize recent argon2 verify results. The cache keeps up to eight
+    # plaintext passwords in process memory, so leave off unless needed.
+    password_verify_cache: bool = False
 
     model_config = SettingsConfigDict(env_prefix="APP_", env_file=".env")
 
@@ -6,23 +6,30 @@ them only when needed for daemon communication.
 
 import base64
 import hashlib
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 
 from backend.app.config import get_settings
 
 
+@lru_cache(maxsize=1)
+def _fernet_for_key(psk_encryption_key: str) -> Fernet:
+    raw_key = psk_encryption_key.encode("utf-8")
+    # Derive a 32-byte key via SHA-256, then base64-encode for Fernet
+    derived = hashlib.sha256(raw_key).digest()
+    fernet_key = base64.urlsafe_b64encode(derived)
+    return Fernet(fernet_key)
+
+
 def _get_fernet() -> Fernet:
     """Get Fernet instance using the configured encryption key.
 
     The PSK_ENCRYPTION_KEY from settings is hashed to produce
-    a valid 32-byte Fernet key.
+    a valid 32-byte Fernet key. The instance is cached per key, so
+    a changed setting builds a fresh one.
     """
-    raw_key = get_settings().psk_encryption_key.encode("utf-8")
-    # Derive a 32-byte key via SHA-256, then base64-encode for Fernet
-    derived = hashlib.sha256(raw_key).digest()
-    fernet_key = base64.urlsafe_b64encode(derived)
-    return Fernet(fernet_key)
+    return _fernet_for_key(get_settings().psk_encryption_key)
 
 
 def encrypt_psk(plaintext: str) -> str:
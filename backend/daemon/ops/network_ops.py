@@ -4,12 +4,52 @@ Applies IP configuration to namespace-specific interfaces via system commands.
 Generates persistent network configuration files in /etc/netns/.
 """
 
+import atexit
+import errno
 import ipaddress
+import json
 import logging
+import os
+import re
+import socket
+import struct
 import subprocess
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from pyroute2 import IPRoute, NetlinkError, NetNS
+    from pyroute2.netlink import (
+        NLM_F_ACK,
+        NLM_F_CREATE,
+        NLM_F_EXCL,
+        NLM_F_REPLACE,
+        NLM_F_REQUEST,
+    )
+    from pyroute2.netlink.rtnl import (
+        RTM_DELADDR,
+        RTM_NEWADDR,
+        RTM_NEWLINK,
+        RTM_NEWROUTE,
+        rt_proto,
+        rt_scope,
+        rt_type,
+    )
+    from pyroute2.netlink.rtnl.ifaddrmsg import ifaddrmsg
+    from pyroute2.netlink.rtnl.ifinfmsg import IFF_UP, ifinfmsg
+    from pyroute2.netlink.rtnl.rtmsg import rtmsg
+except ImportError:  # pyroute2 is installed in the appliance image only
+    IPRoute = NetNS = None
+    NetlinkError = OSError
+
+try:
+    from nftables import Nftables
+except ImportError:  # libnftables bindings (py3-nftables) ship in the image only
+    Nftables = None
+
 logger = logging.getLogger(__name__)
 
 Runner = Callable[..., subprocess.CompletedProcess]
@@ -21,6 +61,73 @@ INTERFACE_MAP = {
     "MGMT": {"namespace": "ns_mgmt", "device": "eth0"},
 }
 
+# Case-insensitive lookup: lowercased interface name -> INTERFACE_MAP key
+_IFACE_BY_LOWER = {name.lower(): name for name in INTERFACE_MAP}
+
+# Persistent per-namespace interface config written by write_netns_config
+_NETNS_CONFIG_TEMPLATE = (
+    "# Auto-generated by encryptor-sim daemon\n"
+    "# Namespace: {namespace}\n"
+    "auto {device}\n"
+    "iface {device} inet static\n"
+    "    address {ip_address}/{prefix_len}\n"
+    "    netmask {netmask}\n"
+    "    gateway {gateway}\n"
+)
+
+# Bind-mount directory for named network namespaces (see ip-netns(8))
+NETNS_RUN_DIR = "/var/run/netns"
+
+# Main routing table id (RT_TABLE_MAIN), used by plain "ip route" commands
+RT_TABLE_MAIN = 254
+
+# Netlink sockets reused across daemon requests, keyed by namespace name
+# ("default" is the daemon's own namespace). Opened lazily on first use.
+_NL_SOCKETS: dict[str, "IPRoute"] = {}
+
+# One /proc/net/dev device line: "<dev>: <8 rx counters> <8 tx counters>".
+# Captures rx bytes/packets/errs and tx bytes/packets/errs.
+_PROC_NET_DEV_RE = re.compile(
+    r"^\s*(?P<device>[^\s:]+):\s*"
+    r"(?P<bytesRx>\d+)\s+(?P<packetsRx>\d+)\s+(?P<errorsRx>\d+)\s+"
+    r"(?:\d+\s+){5}"
+    r"(?P<bytesTx>\d+)\s+(?P<packetsTx>\d+)\s+(?P<errorsTx>\d+)",
+    re.MULTILINE,
+)
+
+
+# Addresses rejected as interface IPs: 0.0.0.0 and the limited broadcast
+_RESERVED_IPV4_INTS = frozenset({0x00000000, 0xFFFFFFFF})
+
+
+def _ipv4_to_int(address: str) -> int:
+    """Convert a strict dotted-quad IPv4 string to an integer.
+
+    Raises:
+        OSError: If the string is not a valid dotted-quad address.
+    """
+    return struct.unpack("!I", socket.inet_pton(socket.AF_INET, address))[0]
+
+
+@lru_cache(maxsize=256)
+def _parse_ipv4_network(address: str, netmask: str) -> ipaddress.IPv4Network:
+    """Parse an address/netmask pair into its containing network (cached)."""
+    return ipaddress.IPv4Network(f"{address}/{netmask}", strict=False)
+
+
+def _canonical_interface_name(name: str) -> str:
+    """Return the INTERFACE_MAP key for a case-insensitive interface name.
+
+    Raises:
+        ValueError: If the name is not a known interface.
+    """
+    if name in INTERFACE_MAP:
+        return name
+    canonical = _IFACE_BY_LOWER.get(name.lower())
+    if canonical is None:
+        raise ValueError(f"Unknown interface: {name}")
+    return canonical
+
 
 def validate_interface_config(
     name: str, ip_address: str, netmask: str, gateway: str
@@ -29,36 +136,203 @@ def validate_interface_config(
 
     Raises ValueError for invalid inputs.
     """
-    name_upper = name.upper()
-    if name_upper not in INTERFACE_MAP:
-        raise ValueError(f"Unknown interface: {name}")
+    _canonical_interface_name(name)
 
     try:
-        addr = ipaddress.IPv4Address(ip_address)
-    except (ipaddress.AddressValueError, ValueError):
+        addr = _ipv4_to_int(ip_address)
+    except (OSError, TypeError):
         raise ValueError(f"Invalid IP address: {ip_address}")
 
-    if addr.is_unspecified or str(addr) == "255.255.255.255":
+    if addr in _RESERVED_IPV4_INTS:
         raise ValueError(f"Reserved IP address not allowed: {ip_address}")
 
     try:
-        ipaddress.IPv4Network(f"0.0.0.0/{netmask}")
+        prefix_len = _netmask_to_prefix(netmask)
     except (ValueError, ipaddress.NetmaskValueError):
         raise ValueError(f"Invalid netmask: {netmask}")
 
     try:
-        gw = ipaddress.IPv4Address(gateway)
-    except (ipaddress.AddressValueError, ValueError):
+        gw = _ipv4_to_int(gateway)
+    except (OSError, TypeError):
         raise ValueError(f"Invalid gateway: {gateway}")
 
-    network = ipaddress.IPv4Network(f"{ip_address}/{netmask}", strict=False)
-    if gw not in network:
+    mask = (0xFFFFFFFF << (32 - prefix_len)) & 0xFFFFFFFF
+    if (addr ^ gw) & mask:
+        network = _parse_ipv4_network(ip_address, netmask)
         raise ValueError(f"Gateway {gateway} not in subnet {network}")
 
 
 def _netmask_to_prefix(netmask: str) -> int:
     """Convert dotted netmask to CIDR prefix length."""
-    return ipaddress.IPv4Network(f"0.0.0.0/{netmask}").prefixlen
+    return _parse_ipv4_network("0.0.0.0", netmask).prefixlen
+
+
+def _get_netns_socket(namespace: str) -> "IPRoute":
+    """Return the cached netlink socket for a namespace, opening it if needed.
+
+    Named namespaces are opened with ``flags=0`` so a missing one raises
+    instead of being created empty (pyroute2 defaults to ``O_CREAT``).
+
+    Args:
+        namespace: Network namespace name, or "default" for the daemon's own.
+
+    Raises:
+        OSError: If the named namespace does not exist.
+    """
+    sock = _NL_SOCKETS.get(namespace)
+    if sock is None:
+        sock = IPRoute() if namespace == "default" else NetNS(namespace, flags=0)
+        _NL_SOCKETS[namespace] = sock
+    return sock
+
+
+def _close_netns_socket(namespace: str) -> None:
+    """Close and forget the cached netlink socket for a namespace."""
+    sock = _NL_SOCKETS.pop(namespace, None)
+    if sock is None:
+        return
+    try:
+        sock.close()
+    except Exception as e:
+        logger.warning(f"Failed to close netlink socket for {namespace}: {e}")
+
+
+def _close_all_netlink() -> None:
+    """Close every cached netlink socket (registered to run at exit)."""
+    for namespace in list(_NL_SOCKETS):
+        _close_netns_socket(namespace)
+
+
+atexit.register(_close_all_netlink)
+
+
+def _rtnl_request(msg, msg_type: int, flags: int = 0):
+    """Fill in the netlink header for an acknowledged rtnetlink request."""
+    msg["header"]["type"] = msg_type
+    msg["header"]["flags"] = NLM_F_REQUEST | NLM_F_ACK | flags
+    return msg
+
+
+def _addr_msg(
+    msg_type: int, index: int, family: int, address: str, prefix_len: int,
+    flags: int = 0,
+):
+    """Build an RTM_NEWADDR/RTM_DELADDR request for one address."""
+    msg = ifaddrmsg()
+    msg["family"] = family
+    msg["prefixlen"] = prefix_len
+    msg["index"] = index
+    msg["attrs"] = [("IFA_LOCAL", address), ("IFA_ADDRESS", address)]
+    return _rtnl_request(msg, msg_type, flags)
+
+
+def _link_up_msg(index: int):
+    """Build an RTM_NEWLINK request that sets IFF_UP on a link."""
+    msg = ifinfmsg()
+    msg["index"] = index
+    msg["flags"] = IFF_UP
+    msg["change"] = IFF_UP
+    return _rtnl_request(msg, RTM_NEWLINK)
+
+
+def _route_replace_msg(gateway: str, dst: str | None = None, dst_len: int = 0):
+    """Build an RTM_NEWROUTE replace request (default route if no dst)."""
+    msg = rtmsg()
+    msg["family"] = socket.AF_INET
+    msg["dst_len"] = dst_len
+    msg["table"] = RT_TABLE_MAIN
+    msg["proto"] = rt_proto["boot"]
+    msg["scope"] = rt_scope["universe"]
+    msg["type"] = rt_type["unicast"]
+    msg["attrs"] = [("RTA_GATEWAY", gateway)]
+    if dst is not None:
+        msg["attrs"].append(("RTA_DST", dst))
+    return _rtnl_request(msg, RTM_NEWROUTE, NLM_F_CREATE | NLM_F_REPLACE)
+
+
+def _flush_addresses_netlink(ns: "IPRoute", index: int) -> None:
+    """Delete every address on a link, tolerating already-removed ones.
+
+    Deleting a primary address makes the kernel drop its secondaries too, so
+    later deletes from the same dump may fail with EADDRNOTAVAIL. Each delete
+    is sent on its own so such a failure cannot abort the rest of the
+    configuration.
+    """
+    for addr in ns.get_addr(index=index):
+        msg = _addr_msg(
+            RTM_DELADDR, index, addr["family"],
+            addr.get_attr("IFA_LOCAL") or addr.get_attr("IFA_ADDRESS"),
+            addr["prefixlen"],
+        )
+        try:
+            ns.nlm_request_batch([msg])
+        except NetlinkError as e:
+            if e.code != errno.EADDRNOTAVAIL:
+                raise
+
+
+def _configure_interface_netlink(
+    namespace: str,
+    device: str,
+    ip_address: str,
+    prefix_len: int,
+    gateway: str,
+    pt_network: ipaddress.IPv4Network | None,
+) -> None:
+    """Apply interface configuration over the namespace's netlink socket.
+
+    Performs the same steps as the ``ip`` command sequence in
+    configure_interface without spawning any processes. Existing addresses
+    are flushed first; the address add, link up and default route replace
+    then go out as a single multi-message batch, which the kernel handles
+    in order and acknowledges message by message. The batch is not atomic:
+    if it fails, the flushed addresses are not restored and the partial
+    state is logged before the error is re-raised.
+
+    Raises:
+        ValueError: If the device does not exist in the namespace.
+        NetlinkError: If the kernel rejects a request.
+        OSError: If the namespace does not exist.
+    """
+    try:
+        ns = _get_netns_socket(namespace)
+        indexes = ns.link_lookup(ifname=device)
+        if not indexes:
+            raise ValueError(f"Device {device} not found in {namespace}")
+        index = indexes[0]
+
+        _flush_addresses_netlink(ns, index)
+        try:
+            ns.nlm_request_batch([
+                _addr_msg(
+                    RTM_NEWADDR, index, socket.AF_INET, ip_address, prefix_len,
+                    NLM_F_CREATE | NLM_F_EXCL,
+                ),
+                _link_up_msg(index),
+                _route_replace_msg(gateway),
+            ])
+        except NetlinkError as e:
+            # The batch is not atomic and the old addresses are already gone
+            logger.error(
+                f"{device} in {namespace} is partially configured: existing "
+                f"addresses were flushed but applying {ip_address}/{prefix_len} "
+                f"via {gateway} failed: {e}"
+            )
+            raise
+
+        if pt_network is not None:
+            _get_netns_socket("default").nlm_request_batch([
+                _route_replace_msg(
+                    "169.254.0.2",
+                    dst=str(pt_network.network_address),
+                    dst_len=pt_network.prefixlen,
+                )
+            ])
+    except (NetlinkError, OSError, ValueError):
+        # The namespace may have been recreated, leaving the cached socket in
+        # the old one (seen as a missing device); reopen on the next request
+        _close_netns_socket(namespace)
+        raise
 
 
 def configure_interface(
@@ -67,7 +341,7 @@ def configure_interface(
     netmask: str,
     gateway: str,
     *,
-    runner: Runner = subprocess.run,
+    runner: Runner | None = None,
     config_base_dir: str = "/etc/netns",
 ) -> dict[str, str]:
     """Configure a network interface in its namespace.
@@ -77,7 +351,9 @@ def configure_interface(
         ip_address: IPv4 address.
         netmask: IPv4 netmask in dotted notation.
         gateway: IPv4 gateway address.
-        runner: Command runner (injectable for testing).
+        runner: Command runner (injectable for testing). When omitted, the
+            configuration is applied over cached netlink sockets if pyroute2
+            is available, otherwise via ``ip`` commands.
         config_base_dir: Base directory for netns config files.
 
     Returns:
@@ -86,8 +362,9 @@ def configure_interface(
     Raises:
         ValueError: If configuration parameters are invalid.
         subprocess.CalledProcessError: If system commands fail.
+        NetlinkError: If a netlink request fails.
     """
-    name_upper = name.upper()
+    name_upper = _canonical_interface_name(name)
     validate_interface_config(name_upper, ip_address, netmask, gateway)
 
     mapping = INTERFACE_MAP[name_upper]
@@ -95,6 +372,22 @@ def configure_interface(
     device = mapping["device"]
     prefix_len = _netmask_to_prefix(netmask)
 
+    if runner is None and NetNS is not None:
+        pt_network = None
+        if name_upper == "PT":
+            pt_network = _parse_ipv4_network(ip_address, netmask)
+        _configure_interface_netlink(
+            namespace, device, ip_address, prefix_len, gateway, pt_network
+        )
+        write_netns_config(
+            namespace, device, ip_address, netmask, gateway,
+            base_dir=config_base_dir,
+        )
+        return _configured_result(namespace, device, ip_address)
+
+    if runner is None:
+        runner = subprocess.run
+
     # Flush existing IP configuration
     runner(
         ["ip", "netns", "exec", namespace, "ip", "addr", "flush", "dev", device],
@@ -139,7 +432,7 @@ def configure_interface(
     # Add route for the PT subnet in the default namespace via the veth pair,
     # so traffic arriving on xfrm interfaces can reach ns_pt.
     if name_upper == "PT":
-        network = ipaddress.IPv4Network(f"{ip_address}/{netmask}", strict=False)
+        network = _parse_ipv4_network(ip_address, netmask)
         runner(
             ["ip", "route", "replace", str(network), "via", "169.254.0.2"],
             check=True,
@@ -152,6 +445,13 @@ def configure_interface(
         base_dir=config_base_dir,
     )
 
+    return _configured_result(namespace, device, ip_address)
+
+
+def _configured_result(
+    namespace: str, device: str, ip_address: str
+) -> dict[str, str]:
+    """Build the configure_interface success response."""
     return {
         "status": "success",
         "message": "Interface configured successfully",
@@ -199,20 +499,25 @@ def write_netns_config(
     config_path = config_dir / device
     prefix_len = _netmask_to_prefix(netmask)
 
-    config_content = (
-        f"# Auto-generated by encryptor-sim daemon\n"
-        f"# Namespace: {namespace}\n"
-        f"auto {device}\n"
-        f"iface {device} inet static\n"
-        f"    address {ip_address}/{prefix_len}\n"
-        f"    netmask {netmask}\n"
-        f"    gateway {gateway}\n"
-    )
-
+    config_content = _NETNS_CONFIG_TEMPLATE.format_map({
+        "namespace": namespace,
+        "device": device,
+        "ip_address": ip_address,
+        "prefix_len": prefix_len,
+        "netmask": netmask,
+        "gateway": gateway,
+    })
+
+    # Write to a sibling temp file and rename over the target so readers
+    # never observe a partially written config.
+    tmp_path = config_path.with_suffix(".tmp")
     try:
-        config_path.write_text(config_content)
+        tmp_path.write_text(config_content)
+        os.replace(tmp_path, config_path)
     except OSError as e:
         logger.error(f"Failed to write config file {config_path}: {e}")
+        with suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
         raise IOError(f"Cannot write config file: {e}") from e
 
     # Verify the file was written successfully
@@ -272,25 +577,17 @@ def _parse_proc_net_dev(output: str, device: str) -> dict[str, int]:
     Returns:
         Dict with bytesRx, bytesTx, packetsRx, packetsTx, errorsRx, errorsTx.
     """
-    for line in output.splitlines():
-        stripped = line.strip()
-        if stripped.startswith(f"{device}:"):
-            # Format: device: rx_bytes rx_packets rx_errs ... tx_bytes tx_packets tx_errs ...
-            parts = stripped.split(":", 1)[1].split()
-            if len(parts) >= 11:
-                return {
-                    "bytesRx": int(parts[0]),
-                    "packetsRx": int(parts[1]),
-                    "errorsRx": int(parts[2]),
-                    "bytesTx": int(parts[8]),
-                    "packetsTx": int(parts[9]),
-                    "errorsTx": int(parts[10]),
-                }
-    return {
-        "bytesRx": 0, "bytesTx": 0,
-        "packetsRx": 0, "packetsTx": 0,
-        "errorsRx": 0, "errorsTx": 0,
-    }
+    for match in _PROC_NET_DEV_RE.finditer(output):
+        if match.group("device") == device:
+            return {
+                "bytesRx": int(match.group("bytesRx")),
+                "packetsRx": int(match.group("packetsRx")),
+                "errorsRx": int(match.group("errorsRx")),
+                "bytesTx": int(match.group("bytesTx")),
+                "packetsTx": int(match.group("packetsTx")),
+                "errorsTx": int(match.group("errorsTx")),
+            }
+    return _zero_stats()
 
 
 def _zero_stats() -> dict[str, int]:
@@ -302,60 +599,189 @@ def _zero_stats() -> dict[str, int]:
     }
 
 
+@contextmanager
+def _enter_netns(namespace: str) -> Iterator[None]:
+    """Move the calling thread into a named network namespace for the block.
+
+    Only the calling thread switches namespace (setns(2) with
+    CLONE_NEWNET); it is moved back to its original namespace on exit.
+
+    Raises:
+        OSError: If setns is unavailable or the namespace cannot be entered.
+    """
+    if not hasattr(os, "setns"):
+        raise OSError("os.setns is not available on this platform")
+
+    original_fd = os.open("/proc/thread-self/ns/net", os.O_RDONLY)
+    try:
+        target_fd = os.open(f"{NETNS_RUN_DIR}/{namespace}", os.O_RDONLY)
+        try:
+            os.setns(target_fd, os.CLONE_NEWNET)
+        finally:
+            os.close(target_fd)
+        try:
+            yield
+        finally:
+            os.setns(original_fd, os.CLONE_NEWNET)
+    finally:
+        os.close(original_fd)
+
+
+def _read_proc_net_dev_in_netns(namespace: str) -> str:
+    """Read /proc/net/dev as seen from inside a named network namespace.
+
+    Reads the thread's procfs view while inside the namespace, avoiding
+    the ip + cat process pair that ``ip netns exec`` would spawn.
+
+    Raises:
+        OSError: If the namespace cannot be entered or read.
+    """
+    with _enter_netns(namespace):
+        with open("/proc/thread-self/net/dev") as f:
+            return f.read()
+
+
+def _read_namespace_stats(
+    iface_name: str,
+    namespace: str,
+    device: str,
+    runner: Runner | None,
+) -> dict[str, int]:
+    """Read /proc/net/dev inside one namespace and parse stats for a device.
+
+    Without an injected runner the file is read in-process via setns,
+    falling back to ``ip netns exec`` if that is not possible.
+    Failures are logged and reported as zeroed stats.
+    """
+    if runner is None:
+        try:
+            return _parse_proc_net_dev(
+                _read_proc_net_dev_in_netns(namespace), device
+            )
+        except OSError as e:
+            logger.debug(f"In-process stats read failed for {namespace}: {e}")
+        runner = subprocess.run
+
+    try:
+        result = runner(
+            ["ip", "netns", "exec", namespace, "cat", "/proc/net/dev"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode != 0:
+            logger.error(
+                f"Failed to read stats for {iface_name} in {namespace}: "
+                f"{result.stderr.strip()}"
+            )
+            return _zero_stats()
+
+        return _parse_proc_net_dev(result.stdout, device)
+
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Cannot read stats for {iface_name}: {e}")
+        return _zero_stats()
+
+
 def get_interface_stats(
     *,
-    runner: Runner = subprocess.run,
+    runner: Runner | None = None,
 ) -> dict[str, dict[str, int]]:
     """Query interface statistics for CT, PT, MGMT namespaces.
 
     Reads /proc/net/dev inside each network namespace to get
-    bytes, packets, and error counts.
+    bytes, packets, and error counts. The per-namespace reads run
+    concurrently since each is dominated by process spawn time.
 
     Args:
-        runner: Command runner (injectable for testing).
+        runner: Command runner (injectable for testing). When omitted,
+            stats are read in-process via setns where supported.
 
     Returns:
         Dict mapping interface name to stats dict with keys:
         bytesRx, bytesTx, packetsRx, packetsTx, errorsRx, errorsTx.
     """
-    stats: dict[str, dict[str, int]] = {}
-
-    for iface_name, mapping in INTERFACE_MAP.items():
-        namespace = mapping["namespace"]
-        device = mapping["device"]
-        try:
-            result = runner(
-                ["ip", "netns", "exec", namespace, "cat", "/proc/net/dev"],
-                capture_output=True,
-                text=True,
-                timeout=5,
+    with ThreadPoolExecutor(max_workers=len(INTERFACE_MAP)) as executor:
+        futures = {
+            iface_name: executor.submit(
+                _read_namespace_stats,
+                iface_name,
+                mapping["namespace"],
+                mapping["device"],
+                runner,
             )
-            if result.returncode != 0:
-                logger.error(
-                    f"Failed to read stats for {iface_name} in {namespace}: "
-                    f"{result.stderr.strip()}"
-                )
-                stats[iface_name] = _zero_stats()
-                continue
+            for iface_name, mapping in INTERFACE_MAP.items()
+        }
+
+    return {iface_name: future.result() for iface_name, future in futures.items()}
 
-            stats[iface_name] = _parse_proc_net_dev(result.stdout, device)
 
-        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
-            logger.warning(f"Cannot read stats for {iface_name}: {e}")
-            stats[iface_name] = _zero_stats()
+def _nft_forward_policy(namespace: str) -> str | None:
+    """Query the isolation forward chain policy through libnftables.
+
+    Args:
+        namespace: Network namespace name, or "default" for the daemon's own.
+
+    Returns:
+        The chain policy (e.g. "drop"), or None if the chain is missing.
+
+    Other namespaces are entered on a short-lived worker thread, so a failed
+    switch back cannot leave a long-lived daemon thread in that namespace.
+
+    Raises:
+        OSError: If the namespace cannot be entered.
+    """
+    def list_policy() -> str | None:
+        nft = Nftables()
+        nft.set_json_output(True)
+        rc, output, _error = nft.cmd("list chain inet isolation forward")
+        if rc != 0:
+            return None
+        for item in json.loads(output).get("nftables", []):
+            chain = item.get("chain")
+            if chain is not None:
+                return chain.get("policy")
+        return None
+
+    def list_policy_in_netns() -> str | None:
+        with _enter_netns(namespace):
+            return list_policy()
 
-    return stats
+    if namespace == "default":
+        return list_policy()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(list_policy_in_netns).result()
 
 
 def verify_isolation_after_config(
     *,
-    runner: Runner = subprocess.run,
+    runner: Runner | None = None,
 ) -> dict[str, str]:
     """Verify isolation rules are still in place after configuration.
 
+    Args:
+        runner: Command runner (injectable for testing). When omitted, the
+            ruleset is queried through libnftables if available, otherwise
+            via the ``nft`` command.
+
     Returns:
         Dict with verification status.
     """
+    if runner is None and Nftables is not None:
+        try:
+            for namespace in ("default", "ns_pt"):
+                policy = _nft_forward_policy(namespace)
+                if policy is None:
+                    return _isolation_missing(namespace)
+                if policy != "drop":
+                    return _isolation_policy_not_drop(namespace)
+            return {"status": "pass", "message": "Isolation rules verified"}
+        except OSError as e:
+            logger.debug(f"libnftables isolation check failed: {e}")
+
+    if runner is None:
+        runner = subprocess.run
+
     for namespace in ("default", "ns_pt"):
         if namespace == "default":
             cmd = ["nft", "list", "chain", "inet", "isolation", "forward"]
@@ -371,25 +797,33 @@ def verify_isolation_after_config(
             check=False,
         )
         if getattr(result, "returncode", 0) != 0:
-            return {
-                "status": "fail",
-                "message": f"Isolation rules missing in {namespace}",
-            }
+            return _isolation_missing(namespace)
         output = getattr(result, "stdout", "") or ""
         if "policy drop" not in output:
-            return {
-                "status": "fail",
-                "message": (
-                    f"Isolation forward policy not set to drop in {namespace}"
-                ),
-            }
+            return _isolation_policy_not_drop(namespace)
 
     return {"status": "pass", "message": "Isolation rules verified"}
 
 
+def _isolation_missing(namespace: str) -> dict[str, str]:
+    """Build the failure result for a missing isolation chain."""
+    return {
+        "status": "fail",
+        "message": f"Isolation rules missing in {namespace}",
+    }
+
+
+def _isolation_policy_not_drop(namespace: str) -> dict[str, str]:
+    """Build the failure result for a non-drop forward policy."""
+    return {
+        "status": "fail",
+        "message": f"Isolation forward policy not set to drop in {namespace}",
+    }
+
+
 def restore_interface_configs_from_db(
     *,
-    runner: Runner = subprocess.run,
+    runner: Runner | None = None,
     config_base_dir: str = "/etc/netns",
 ) -> dict[str, list[str]]:
     """Restore interface configurations from database on daemon startup.
@@ -8,13 +8,25 @@ import logging
 import re
 import subprocess
 import time
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 Runner = Callable[..., subprocess.CompletedProcess]
 
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9_-]")
+# "established: 3600 seconds ago"
+_ESTABLISHED_RE = re.compile(r"established:\s*(\d+)")
+# "bytes_in:  1024, bytes_out:  2048" / "packets_in:  10, packets_out:  20"
+_COUNTER_RE = re.compile(r"\b(bytes_in|bytes_out|packets_in|packets_out):\s*([^,\s]*)")
+_COUNTER_FIELDS = {
+    "bytes_in": "bytesIn",
+    "bytes_out": "bytesOut",
+    "packets_in": "packetsIn",
+    "packets_out": "packetsOut",
+}
+
 
 def _sanitize_name(name: str) -> str:
     """Sanitize a peer name for use as a strongSwan configuration identifier.
@@ -22,7 +34,7 @@ def _sanitize_name(name: str) -> str:
     Replaces spaces and other non-alphanumeric characters (except hyphens
     and underscores) with underscores to produce a valid swanctl identifier.
     """
-    return re.sub(r"[^a-zA-Z0-9_-]", "_", name)
+    return _UNSAFE_NAME_CHARS_RE.sub("_", name)
 
 SWANCTL_CONF_DIR = "/etc/swanctl/conf.d"
 CT_NAMESPACE = "ns_ct"
@@ -32,6 +44,7 @@ def _swanctl_cmd(*args: str) -> list[str]:
     """Build a swanctl command that runs inside the CT namespace."""
     return ["ip", "netns", "exec", CT_NAMESPACE, "swanctl", *args]
 
+
 _PEER_NAME_CACHE: dict[str, int] = {}
 _PEER_CACHE_LAST_REFRESH: float = 0.0
 _PEER_CACHE_TTL_SECONDS = 5.0
@@ -627,7 +640,7 @@ def _parse_ike_state(state: str) -> str:
 def get_tunnel_status(
     *,
     runner: Runner = subprocess.run,
-    peer_id_lookup: Callable[[Iterable[str]], dict[str, int]] | None = None,
+    peer_id_lookup: Callable[[Iterable[str]], Mapping[str, int]] | None = None,
 ) -> dict[int, str]:
     """Query strongSwan for tunnel status via swanctl --list-sas.
 
@@ -673,7 +686,7 @@ def get_tunnel_status(
 def get_tunnel_telemetry(
     *,
     runner: Runner = subprocess.run,
-    peer_id_lookup: Callable[[Iterable[str]], dict[str, int]] | None = None,
+    peer_id_lookup: Callable[[Iterable[str]], Mapping[str, int]] | None = None,
 ) -> dict[int, dict]:
     """Query strongSwan for tunnel telemetry via swanctl --list-sas.
 
@@ -777,7 +790,7 @@ def _parse_list_sas_telemetry(output: str) -> dict[str, dict]:
             continue
 
         # IKE SA lines start at column 0 (not indented)
-        if line and not line[0].isspace() and ":" in line:
+        if not line[0].isspace() and ":" in line:
             # Format: "conn-name: #N, STATE, ..."
             name_part, _, rest = line.partition(":")
             name = name_part.strip()
@@ -801,53 +814,20 @@ def _parse_list_sas_telemetry(output: str) -> dict[str, dict]:
             current_conn = name
 
         # Indented lines contain telemetry data
-        elif line and line[0].isspace() and current_conn:
+        elif line[0].isspace() and current_conn:
             stripped = line.strip()
+            telemetry = telemetry_map[current_conn]
 
             # Parse "established: N seconds ago"
-            if stripped.startswith("established:"):
+            if match := _ESTABLISHED_RE.match(stripped):
+                telemetry["establishedSec"] = int(match.group(1))
+
+            # Parse traffic and packet counters; unparsable values stay 0
+            for counter, value in _COUNTER_RE.findall(stripped):
                 try:
-                    # Extract number from "established: 3600 seconds ago"
-                    parts = stripped.split()
-                    if len(parts) >= 2:
-                        sec = int(parts[1])
-                        telemetry_map[current_conn]["establishedSec"] = sec
-                except (ValueError, IndexError):
-                    pass  # Default to 0
-
-            # Parse traffic counters: "bytes_in:  1024, bytes_out:  2048"
-            if "bytes_in:" in stripped or "bytes_out:" in stripped:
-                for part in stripped.split(","):
-                    part = part.strip()
-                    if "bytes_in:" in part:
-                        try:
-                            val = int(part.split(":")[1].strip())
-                            telemetry_map[current_conn]["bytesIn"] = val
-                        except (ValueError, IndexError):
-                            pass  # Default to 0
-                    elif "bytes_out:" in part:
-                        try:
-                            val = int(part.split(":")[1].strip())
-                            telemetry_map[current_conn]["bytesOut"] = val
-                        except (ValueError, IndexError):
-                            pass  # Default to 0
-
-            # Parse packet counters: "packets_in:  10, packets_out:  20"
-            if "packets_in:" in stripped or "packets_out:" in stripped:
-                for part in stripped.split(","):
-                    part = part.strip()
-                    if "packets_in:" in part:
-                        try:
-                            val = int(part.split(":")[1].strip())
-                            telemetry_map[current_conn]["packetsIn"] = val
-                        except (ValueError, IndexError):
-                            pass  # Default to 0
-                    elif "packets_out:" in part:
-                        try:
-                            val = int(part.split(":")[1].strip())
-                            telemetry_map[current_conn]["packetsOut"] = val
-                        except (ValueError, IndexError):
-                            pass  # Default to 0
+                    telemetry[_COUNTER_FIELDS[counter]] = int(value)
+                except ValueError:
+                    pass
 
     return telemetry_map
 
@@ -4,6 +4,7 @@ Creates and manages XFRM interfaces (xfrmi) in the default namespace
 to route decrypted traffic between ns_ct (strongSwan) and ns_pt (plaintext).
 """
 
+import json
 import logging
 import subprocess
 from collections.abc import Callable
@@ -60,41 +61,26 @@ def create_xfrm_interface(
     )
 
     # Create xfrmi device inside ns_ct, linked to the CT device (eth1).
-    # This binds the interface to ns_ct's XFRM SA/SP database.
+    # This binds the interface to ns_ct's XFRM SA/SP database. Then move it
+    # to the default namespace (PID 1); the interface retains its link-netns
+    # association with ns_ct.
     runner(
-        [
-            "ip", "netns", "exec", CT_NAMESPACE,
-            "ip", "link", "add", dev_name,
-            "type", "xfrm",
-            "dev", CT_DEVICE,
-            "if_id", str(if_id),
-        ],
-        capture_output=True,
-        check=True,
-    )
-
-    # Move xfrmi device from ns_ct to the default namespace (PID 1).
-    # The interface retains its link-netns association with ns_ct.
-    runner(
-        [
-            "ip", "netns", "exec", CT_NAMESPACE,
-            "ip", "link", "set", dev_name, "netns", "1",
-        ],
-        capture_output=True,
-        check=True,
-    )
-
-    # Set MTU to account for IPsec overhead
-    runner(
-        ["ip", "link", "set", dev_name, "mtu", str(XFRM_MTU)],
+        ["ip", "netns", "exec", CT_NAMESPACE, "ip", "-batch", "-"],
+        input=(
+            f"link add {dev_name} type xfrm dev {CT_DEVICE} if_id {if_id}\n"
+            f"link set {dev_name} netns 1\n"
+        ),
         capture_output=True,
+        text=True,
         check=True,
     )
 
-    # Bring interface up
+    # Set MTU to account for IPsec overhead, then bring the interface up
     runner(
-        ["ip", "link", "set", dev_name, "up"],
+        ["ip", "-batch", "-"],
+        input=f"link set {dev_name} mtu {XFRM_MTU}\nlink set {dev_name} up\n",
         capture_output=True,
+        text=True,
         check=True,
     )
 
@@ -163,7 +149,7 @@ def remove_tunnel_routes(
     dev_name = _xfrm_dev_name(peer_id)
     # List routes for this device and remove them
     result = runner(
-        ["ip", "route", "show", "dev", dev_name],
+        ["ip", "-j", "route", "show", "dev", dev_name],
         capture_output=True,
         text=True,
         check=False,
@@ -171,13 +157,24 @@ def remove_tunnel_routes(
     if result.returncode != 0 or not result.stdout.strip():
         return
 
-    for line in result.stdout.strip().splitlines():
-        dest = line.split()[0]
-        runner(
-            ["ip", "route", "del", dest, "dev", dev_name],
-            capture_output=True,
-            check=False,
-        )
+    try:
+        destinations = [route["dst"] for route in json.loads(result.stdout)]
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning(f"Cannot parse routes for {dev_name}: {e}")
+        return
+    if not destinations:
+        return
+    # Delete all routes through one ip process; -force keeps going past
+    # individual failures like the per-route check=False calls did.
+    batch = "".join(f"route del {dest} dev {dev_name}\n" for dest in destinations)
+    runner(
+        ["ip", "-force", "-batch", "-"],
+        input=batch,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    for dest in destinations:
         logger.info(f"Removed route {dest} via {dev_name}")
 
 
@@ -0,0 +1,28 @@
+"""Shared pytest configuration for backend tests."""
+
+import os
+
+FAST_MARKEXPR = "not db and not crypto"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help=f'skip slower tests (same as -m "{FAST_MARKEXPR}")',
+    )
+
+
+def pytest_configure(config):
+    # Settings are read at import time, so these must exist before any test
+    # module imports backend code.
+    os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
+    os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
+
+    if not config.getoption("fast"):
+        return
+    markexpr = config.option.markexpr
+    config.option.markexpr = (
+        f"({markexpr}) and {FAST_MARKEXPR}" if markexpr else FAST_MARKEXPR
+    )
@@ -132,10 +132,26 @@ class TestUvicornHttpsWrapper:
         uvicorn_script = BACKEND_DIR / "uvicorn_server.py"
         content = uvicorn_script.read_text()
 
-        assert "ssl.PROTOCOL_TLSv1_2" in content, (
+        assert "minimum_version < ssl.TLSVersion.TLSv1_2" in content, (
             "Uvicorn must enforce TLS 1.2+ minimum"
         )
 
+    def test_uvicorn_run_keeps_startup_failure_exit(self) -> None:
+        """Verify uvicorn.run is used so bind/cert failures exit non-zero."""
+        uvicorn_script = BACKEND_DIR / "uvicorn_server.py"
+        content = uvicorn_script.read_text()
+
+        assert "uvicorn.run(" in content
+        assert "uvicorn.Server(" not in content
+
+    def test_uvicorn_allows_tls_1_3(self) -> None:
+        """Verify the server context can negotiate TLS 1.3."""
+        uvicorn_script = BACKEND_DIR / "uvicorn_server.py"
+        content = uvicorn_script.read_text()
+
+        assert "ssl.PROTOCOL_TLS_SERVER" in content
+        assert "ssl.PROTOCOL_TLSv1_2" not in content
+
     def test_uvicorn_binds_to_all_interfaces(self) -> None:
         """Verify uvicorn binds to 0.0.0.0 for DHCP-assigned IPs."""
         uvicorn_script = BACKEND_DIR / "uvicorn_server.py"
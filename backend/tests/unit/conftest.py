@@ -0,0 +1,146 @@
+"""Shared fixtures for backend unit tests."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from argon2 import PasswordHasher
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_password_hasher():
+    """Use minimal argon2id cost parameters for the unit test session.
+
+    Unit tests exercise hashing plumbing, not KDF strength, so the library
+    defaults only slow the suite down. Set APP_TEST_FULL_ARGON2=1 to keep
+    the production parameters.
+    """
+    if os.environ.get("APP_TEST_FULL_ARGON2"):
+        yield
+        return
+
+    import backend.app.auth.password as password
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            password, "ph", PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+        )
+        yield
+
+
+@pytest.fixture
+def runner_factory():
+    """Build command runners that record argv and return canned results.
+
+    ``stdout`` is returned for every command unless ``stdout_map`` has an
+    entry whose key is a prefix of the argv. Keyword arguments of each call
+    are kept in ``call_kwargs`` alongside ``calls``. Results are built once
+    per runner, so their ``args`` is empty; read ``calls`` for the argv.
+    """
+
+    def make(
+        stdout: str = "",
+        *,
+        returncode: int = 0,
+        stderr: str = "",
+        stdout_map: dict[tuple[str, ...], str] | None = None,
+    ):
+        calls: list[list[str]] = []
+        call_kwargs: list[dict] = []
+        default = subprocess.CompletedProcess([], returncode, stdout=stdout, stderr=stderr)
+        mapped = {
+            prefix: subprocess.CompletedProcess([], returncode, stdout=out, stderr=stderr)
+            for prefix, out in (stdout_map or {}).items()
+        }
+
+        def run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            call_kwargs.append(kwargs)
+            for prefix, result in mapped.items():
+                if tuple(cmd[: len(prefix)]) == prefix:
+                    return result
+            return default
+
+        run.calls = calls
+        run.call_kwargs = call_kwargs
+        return run
+
+    return make
+
+
+@pytest.fixture
+def recording_runner(runner_factory):
+    """Runner that records each argv and succeeds with empty output."""
+    return runner_factory()
+
+
+@pytest.fixture(scope="session")
+def memory_engine():
+    """Create the in-memory SQLite schema once for the test session."""
+    from backend.app.models import Base
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT rollback;
+    # let SQLAlchemy emit transaction boundaries instead.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(memory_engine):
+    """Run each test in a transaction that is rolled back afterwards.
+
+    Service commits release SAVEPOINTs inside the outer transaction, so
+    nothing persists between tests.
+    """
+    connection = memory_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    """Repository root, for tests that check files outside the backend."""
+    return REPO_ROOT
+
+
+@pytest.fixture(scope="session")
+def security_docs() -> dict[str, str]:
+    """Read the security documentation checked by the doc tests once."""
+    paths = {
+        "report": "docs/security-report.md",
+        "docs_readme": "docs/README.md",
+        "root_readme": "README.md",
+        "security_readme": "docs/security/README.md",
+        "scripts_readme": "scripts/security/README.md",
+    }
+    missing = [path for path in paths.values() if not (REPO_ROOT / path).exists()]
+    assert not missing, f"Security documentation missing: {', '.join(missing)}"
+    return {
+        key: (REPO_ROOT / path).read_text(encoding="utf-8")
+        for key, path in paths.items()
+    }
@@ -1,11 +1,6 @@
 """Unit tests for background polling tasks (Story 5.1, Task 4)."""
 
 import asyncio
-import os
-
-os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
-os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
-
 from unittest.mock import AsyncMock, MagicMock, patch
 from types import SimpleNamespace
 
@@ -1,28 +1,19 @@
-from pathlib import Path
-
-
-def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[3]
-
-
-def test_required_docs_are_present() -> None:
-    root = _repo_root()
+def test_required_docs_are_present(repo_root) -> None:
     required = [
-        root / "docs" / "user-guide.md",
-        root / "docs" / "api-reference.md",
-        root / "docs" / "architecture.md",
-        root / "docs" / "ports-protocols.md",
-        root / "docs" / "security-report.md",
+        repo_root / "docs" / "user-guide.md",
+        repo_root / "docs" / "api-reference.md",
+        repo_root / "docs" / "architecture.md",
+        repo_root / "docs" / "ports-protocols.md",
+        repo_root / "docs" / "security-report.md",
     ]
 
     for path in required:
         assert path.exists(), f"Required documentation file missing: {path}"
 
 
-def test_readme_files_expose_canonical_doc_entry_points() -> None:
-    root = _repo_root()
-    root_readme = (root / "README.md").read_text(encoding="utf-8")
-    docs_readme = (root / "docs" / "README.md").read_text(encoding="utf-8")
+def test_readme_files_expose_canonical_doc_entry_points(repo_root) -> None:
+    root_readme = (repo_root / "README.md").read_text(encoding="utf-8")
+    docs_readme = (repo_root / "docs" / "README.md").read_text(encoding="utf-8")
 
     for token in [
         "docs/README.md",
@@ -44,20 +35,18 @@ def test_readme_files_expose_canonical_doc_entry_points() -> None:
         assert token in docs_readme, f"Docs README missing docs token: {token}"
 
 
-def test_architecture_and_ports_docs_are_not_placeholder_only() -> None:
-    root = _repo_root()
+def test_architecture_and_ports_docs_are_not_placeholder_only(repo_root) -> None:
     for path in [
-        root / "docs" / "architecture.md",
-        root / "docs" / "ports-protocols.md",
+        repo_root / "docs" / "architecture.md",
+        repo_root / "docs" / "ports-protocols.md",
     ]:
         content = path.read_text(encoding="utf-8")
         assert "Placeholder" not in content
         assert len(content.strip()) >= 400, f"{path} is too short to be complete"
 
 
-def test_user_guide_covers_v1_operational_workflows() -> None:
-    root = _repo_root()
-    user_guide = (root / "docs" / "user-guide.md").read_text(encoding="utf-8")
+def test_user_guide_covers_v1_operational_workflows(repo_root) -> None:
+    user_guide = (repo_root / "docs" / "user-guide.md").read_text(encoding="utf-8")
 
     for token in [
         "/login",
@@ -75,16 +64,15 @@ def test_user_guide_covers_v1_operational_workflows() -> None:
         assert token in user_guide, f"User guide missing required token: {token}"
 
 
-def test_user_guide_screenshot_assets_exist() -> None:
-    root = _repo_root()
+def test_user_guide_screenshot_assets_exist(repo_root) -> None:
     screenshots = [
-        root / "image" / "user-guide-login.png",
-        root / "image" / "user-guide-change-password.png",
-        root / "image" / "user-guide-dashboard.png",
-        root / "image" / "user-guide-interfaces.png",
-        root / "image" / "user-guide-peers.png",
-        root / "image" / "user-guide-routes.png",
-        root / "image" / "user-guide-logout.png",
+        repo_root / "image" / "user-guide-login.png",
+        repo_root / "image" / "user-guide-change-password.png",
+        repo_root / "image" / "user-guide-dashboard.png",
+        repo_root / "image" / "user-guide-interfaces.png",
+        repo_root / "image" / "user-guide-peers.png",
+        repo_root / "image" / "user-guide-routes.png",
+        repo_root / "image" / "user-guide-logout.png",
     ]
 
     for screenshot in screenshots:
@@ -92,9 +80,8 @@ def test_user_guide_screenshot_assets_exist() -> None:
         assert screenshot.stat().st_size > 0, f"Empty screenshot asset: {screenshot}"
 
 
-def test_architecture_doc_has_diagram_and_planning_cross_link() -> None:
-    root = _repo_root()
-    architecture_doc = (root / "docs" / "architecture.md").read_text(encoding="utf-8")
+def test_architecture_doc_has_diagram_and_planning_cross_link(repo_root) -> None:
+    architecture_doc = (repo_root / "docs" / "architecture.md").read_text(encoding="utf-8")
 
     for token in [
         "```mermaid",
@@ -106,9 +93,8 @@ def test_architecture_doc_has_diagram_and_planning_cross_link() -> None:
         assert token in architecture_doc, f"Architecture doc missing token: {token}"
 
 
-def test_ports_protocols_doc_covers_required_services_and_checks() -> None:
-    root = _repo_root()
-    ports_doc = (root / "docs" / "ports-protocols.md").read_text(encoding="utf-8")
+def test_ports_protocols_doc_covers_required_services_and_checks(repo_root) -> None:
+    ports_doc = (repo_root / "docs" / "ports-protocols.md").read_text(encoding="utf-8")
     ports_doc_lower = ports_doc.lower()
 
     for token in [
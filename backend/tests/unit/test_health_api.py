@@ -2,19 +2,32 @@
 
 from __future__ import annotations
 
-import os
-
+import pytest
 from fastapi.testclient import TestClient
 
-# Set test environment variables before importing app
-os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
-os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
-
+from backend.app.config import get_settings
+from backend.app.db.deps import _get_session_factory
+from backend.app.db.init import init_db
 from backend.main import app
 
 
 client = TestClient(app)
 
+
+@pytest.fixture(autouse=True, scope="module")
+def _seeded_database(tmp_path_factory):
+    """Seed a throwaway SQLite file with the admin user the login helper uses."""
+    db_path = tmp_path_factory.mktemp("health") / "app.db"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("APP_DATABASE_URL", f"sqlite+pysqlite:///{db_path}")
+        get_settings.cache_clear()
+        _get_session_factory.cache_clear()
+        init_db()
+        yield
+    get_settings.cache_clear()
+    _get_session_factory.cache_clear()
+
+
 def _auth_headers() -> dict[str, str]:
     login_response = client.post(
         "/api/v1/auth/login",
@@ -1,10 +1,5 @@
 """Unit tests for IPsec peer validation service (Story 4.2, Task 3)."""
 
-import os
-
-os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
-os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
-
 from unittest.mock import MagicMock
 
 from backend.app.models.peer import Peer
@@ -4,11 +4,17 @@ Tests verify interface configuration, validation, isolation verification,
 and persistent config file generation.
 """
 
+import contextlib
+import errno
+import json
+import logging
 import subprocess
-from unittest.mock import MagicMock, call
+import threading
+from unittest.mock import MagicMock, Mock, call
 
 import pytest
 
+from backend.daemon.ops import network_ops
 from backend.daemon.ops.network_ops import (
     INTERFACE_MAP,
     _netmask_to_prefix,
@@ -20,6 +26,18 @@ from backend.daemon.ops.network_ops import (
 )
 
 
+@pytest.fixture(scope="module")
+def success_result():
+    """Shared successful CompletedProcess returned by mocked runners."""
+    return subprocess.CompletedProcess(args=[], returncode=0)
+
+
+@pytest.fixture
+def runner(success_result):
+    """Mock runner that succeeds for all commands."""
+    return Mock(spec=subprocess.run, return_value=success_result)
+
+
 # ---------------------------------------------------------------------------
 # Task 2.3: IP address validation in daemon
 # ---------------------------------------------------------------------------
@@ -50,6 +68,11 @@ class TestValidateInterfaceConfig:
         with pytest.raises(ValueError, match="Invalid IP address"):
             validate_interface_config("CT", "999.999.999.999", "255.255.255.0", "10.0.0.254")
 
+    def test_shorthand_ip_raises(self):
+        """Reject inet_aton-style shorthand addresses."""
+        with pytest.raises(ValueError, match="Invalid IP address"):
+            validate_interface_config("CT", "10.1", "255.255.255.0", "10.0.0.254")
+
     def test_reserved_ip_zero_raises(self):
         """Reject 0.0.0.0 as reserved."""
         with pytest.raises(ValueError, match="Reserved IP"):
@@ -104,15 +127,8 @@ class TestNetmaskToPrefix:
 class TestConfigureInterface:
     """Tests for configure_interface with mocked runner (Task 2.1, 2.2)."""
 
-    def _make_runner(self):
-        """Create a mock runner that succeeds for all commands."""
-        runner = MagicMock()
-        runner.return_value = subprocess.CompletedProcess(args=[], returncode=0)
-        return runner
-
-    def test_configure_ct_calls_correct_namespace(self, tmp_path):
+    def test_configure_ct_calls_correct_namespace(self, runner, tmp_path):
         """Verify CT config uses ns_ct namespace."""
-        runner = self._make_runner()
         result = configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -128,9 +144,8 @@ class TestConfigureInterface:
             if "ip" in args and "netns" in args:
                 assert "ns_ct" in args
 
-    def test_configure_pt_calls_correct_namespace(self, tmp_path):
+    def test_configure_pt_calls_correct_namespace(self, runner, tmp_path):
         """Verify PT config uses ns_pt namespace."""
-        runner = self._make_runner()
         result = configure_interface(
             "PT", "10.0.0.1", "255.255.255.0", "10.0.0.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -138,9 +153,8 @@ class TestConfigureInterface:
         assert result["namespace"] == "ns_pt"
         assert result["device"] == "eth2"
 
-    def test_configure_pt_adds_default_ns_route(self, tmp_path):
+    def test_configure_pt_adds_default_ns_route(self, runner, tmp_path):
         """Verify PT config adds a route for the PT subnet in the default namespace."""
-        runner = self._make_runner()
         configure_interface(
             "PT", "10.0.0.1", "255.255.255.0", "10.0.0.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -154,9 +168,8 @@ class TestConfigureInterface:
         ]
         assert len(pt_route_calls) == 1
 
-    def test_configure_ct_does_not_add_pt_route(self, tmp_path):
+    def test_configure_ct_does_not_add_pt_route(self, runner, tmp_path):
         """Verify CT config does NOT add a PT subnet route."""
-        runner = self._make_runner()
         configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -169,9 +182,8 @@ class TestConfigureInterface:
         ]
         assert len(pt_route_calls) == 0
 
-    def test_configure_mgmt_calls_correct_namespace(self, tmp_path):
+    def test_configure_mgmt_calls_correct_namespace(self, runner, tmp_path):
         """Verify MGMT config uses ns_mgmt namespace."""
-        runner = self._make_runner()
         result = configure_interface(
             "MGMT", "192.168.1.100", "255.255.255.0", "192.168.1.1",
             runner=runner, config_base_dir=str(tmp_path),
@@ -179,9 +191,8 @@ class TestConfigureInterface:
         assert result["namespace"] == "ns_mgmt"
         assert result["device"] == "eth0"
 
-    def test_configure_flushes_before_adding(self, tmp_path):
+    def test_configure_flushes_before_adding(self, runner, tmp_path):
         """Verify existing config is flushed before applying new config."""
-        runner = self._make_runner()
         configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -189,9 +200,8 @@ class TestConfigureInterface:
         first_call_args = runner.call_args_list[0][0][0]
         assert "flush" in first_call_args
 
-    def test_configure_adds_ip_with_correct_prefix(self, tmp_path):
+    def test_configure_adds_ip_with_correct_prefix(self, runner, tmp_path):
         """Verify IP address is added with correct CIDR prefix."""
-        runner = self._make_runner()
         configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -201,9 +211,8 @@ class TestConfigureInterface:
         assert len(addr_add_call) > 0
         assert "192.168.10.1/24" in addr_add_call[0][0][0]
 
-    def test_configure_brings_interface_up(self, tmp_path):
+    def test_configure_brings_interface_up(self, runner, tmp_path):
         """Verify interface is brought up after configuration."""
-        runner = self._make_runner()
         configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -212,9 +221,8 @@ class TestConfigureInterface:
         link_up_calls = [c for c in calls if "up" in c[0][0] and "link" in c[0][0]]
         assert len(link_up_calls) > 0
 
-    def test_configure_sets_default_gateway(self, tmp_path):
+    def test_configure_sets_default_gateway(self, runner, tmp_path):
         """Verify default gateway is set."""
-        runner = self._make_runner()
         configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -227,9 +235,8 @@ class TestConfigureInterface:
         assert len(route_calls) > 0
         assert "192.168.10.254" in route_calls[0][0][0]
 
-    def test_configure_returns_success_dict(self, tmp_path):
+    def test_configure_returns_success_dict(self, runner, tmp_path):
         """Verify return value structure."""
-        runner = self._make_runner()
         result = configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -238,9 +245,8 @@ class TestConfigureInterface:
         assert "message" in result
         assert result["ip_address"] == "192.168.10.1"
 
-    def test_configure_writes_persistent_config(self, tmp_path):
+    def test_configure_writes_persistent_config(self, runner, tmp_path):
         """Verify persistent config file is written (Task 3.2)."""
-        runner = self._make_runner()
         configure_interface(
             "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
             runner=runner, config_base_dir=str(tmp_path),
@@ -252,17 +258,17 @@ class TestConfigureInterface:
 
     def test_configure_raises_on_subprocess_failure(self):
         """Verify CalledProcessError propagates from failed commands."""
-        runner = MagicMock()
-        runner.side_effect = subprocess.CalledProcessError(1, "ip")
+        runner = Mock(
+            spec=subprocess.run, side_effect=subprocess.CalledProcessError(1, "ip")
+        )
         with pytest.raises(subprocess.CalledProcessError):
             configure_interface(
                 "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
                 runner=runner,
             )
 
-    def test_configure_validates_before_executing(self):
+    def test_configure_validates_before_executing(self, runner):
         """Verify validation runs before any commands."""
-        runner = self._make_runner()
         with pytest.raises(ValueError, match="Invalid IP"):
             configure_interface(
                 "CT", "999.999.999.999", "255.255.255.0", "10.0.0.254",
@@ -271,6 +277,199 @@ class TestConfigureInterface:
         runner.assert_not_called()
 
 
+class TestConfigureInterfaceNetlink:
+    """Tests for the netlink path used when no runner is injected."""
+
+    @pytest.fixture
+    def netlink(self, monkeypatch):
+        """Replace pyroute2 socket classes with mocks and clear the cache."""
+        pytest.importorskip("pyroute2")
+
+        sockets = {}
+
+        def make_socket(namespace="default", flags=None):
+            sock = MagicMock()
+            sock.link_lookup.return_value = [7]
+            sock.get_addr.return_value = []
+            sockets[namespace] = sock
+            return sock
+
+        monkeypatch.setattr(network_ops, "NetNS", MagicMock(side_effect=make_socket))
+        monkeypatch.setattr(network_ops, "IPRoute", MagicMock(side_effect=make_socket))
+        monkeypatch.setattr(network_ops, "_NL_SOCKETS", {})
+        return sockets
+
+    def test_configure_uses_netns_socket_without_spawning(self, netlink, monkeypatch, tmp_path):
+        """Verify configuration goes through netlink instead of ip commands."""
+        spawn = MagicMock()
+        monkeypatch.setattr(network_ops.subprocess, "run", spawn)
+
+        result = configure_interface(
+            "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+            config_base_dir=str(tmp_path),
+        )
+
+        assert result["status"] == "success"
+        spawn.assert_not_called()
+        assert (tmp_path / "ns_ct" / "network" / "eth1").exists()
+
+    @staticmethod
+    def _dumped_addr(address: str, prefixlen: int):
+        """Build a mock RTM_NEWADDR dump entry for one IPv4 address."""
+        addr = MagicMock()
+        addr.__getitem__.side_effect = {"family": 2, "prefixlen": prefixlen}.__getitem__
+        addr.get_attr.return_value = address
+        return addr
+
+    def test_configure_flushes_then_sends_single_batch(self, netlink, tmp_path):
+        """Verify addresses are flushed, then address, link and route go as one batch."""
+        ns = network_ops._get_netns_socket("ns_ct")
+        ns.get_addr.return_value = [self._dumped_addr("172.16.0.1", 16)]
+
+        configure_interface(
+            "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+            config_base_dir=str(tmp_path),
+        )
+
+        flush, batch = [c.args[0] for c in ns.nlm_request_batch.call_args_list]
+        assert [msg["header"]["type"] for msg in flush] == [network_ops.RTM_DELADDR]
+        assert flush[0].get_attr("IFA_LOCAL") == "172.16.0.1"
+        assert [msg["header"]["type"] for msg in batch] == [
+            network_ops.RTM_NEWADDR,
+            network_ops.RTM_NEWLINK,
+            network_ops.RTM_NEWROUTE,
+        ]
+        assert batch[0]["prefixlen"] == 24
+        assert batch[0].get_attr("IFA_LOCAL") == "192.168.10.1"
+        assert batch[2].get_attr("RTA_GATEWAY") == "192.168.10.254"
+
+    def test_configure_tolerates_secondaries_removed_with_primary(self, netlink, tmp_path):
+        """Verify a secondary dropped along with its primary does not abort config."""
+        ns = network_ops._get_netns_socket("ns_ct")
+        ns.get_addr.return_value = [
+            self._dumped_addr("172.16.0.1", 16),
+            self._dumped_addr("172.16.0.2", 16),
+        ]
+        sent = []
+
+        def request_batch(msgs):
+            # The kernel removed the secondary together with the primary
+            if msgs[0].get_attr("IFA_LOCAL") == "172.16.0.2":
+                raise network_ops.NetlinkError(errno.EADDRNOTAVAIL)
+            sent.append(msgs)
+
+        ns.nlm_request_batch.side_effect = request_batch
+
+        result = configure_interface(
+            "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+            config_base_dir=str(tmp_path),
+        )
+
+        assert result["status"] == "success"
+        assert sent[-1][0].get_attr("IFA_LOCAL") == "192.168.10.1"
+        assert (tmp_path / "ns_ct" / "network" / "eth1").exists()
+
+    def test_configure_netlink_error_closes_socket(self, netlink, tmp_path):
+        """Verify other netlink failures propagate and drop the cached socket."""
+        ns = network_ops._get_netns_socket("ns_ct")
+        ns.nlm_request_batch.side_effect = network_ops.NetlinkError(errno.EPERM)
+
+        with pytest.raises(network_ops.NetlinkError):
+            configure_interface(
+                "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+                config_base_dir=str(tmp_path),
+            )
+        ns.close.assert_called_once()
+        assert "ns_ct" not in network_ops._NL_SOCKETS
+        assert not (tmp_path / "ns_ct").exists()
+
+    def test_configure_batch_failure_logs_partial_state(self, netlink, tmp_path, caplog):
+        """Verify a failed batch after the flush is logged as partial config."""
+        ns = network_ops._get_netns_socket("ns_ct")
+        ns.get_addr.return_value = [self._dumped_addr("172.16.0.1", 16)]
+        ns.nlm_request_batch.side_effect = [None, network_ops.NetlinkError(errno.EEXIST)]
+
+        with caplog.at_level(logging.ERROR, logger=network_ops.logger.name):
+            with pytest.raises(network_ops.NetlinkError):
+                configure_interface(
+                    "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+                    config_base_dir=str(tmp_path),
+                )
+        assert "eth1 in ns_ct is partially configured" in caplog.text
+        assert "192.168.10.1/24" in caplog.text
+
+    def test_configure_pt_replaces_default_ns_route(self, netlink, tmp_path):
+        """Verify PT config adds the PT subnet route in the default namespace."""
+        configure_interface(
+            "PT", "10.0.0.1", "255.255.255.0", "10.0.0.254",
+            config_base_dir=str(tmp_path),
+        )
+        netlink["default"].nlm_request_batch.assert_called_once()
+        (route,) = netlink["default"].nlm_request_batch.call_args[0][0]
+        assert route.get_attr("RTA_DST") == "10.0.0.0"
+        assert route["dst_len"] == 24
+        assert route.get_attr("RTA_GATEWAY") == "169.254.0.2"
+
+    def test_sockets_are_reused_across_calls(self, netlink, tmp_path):
+        """Verify one socket per namespace is opened and then reused."""
+        for _ in range(2):
+            configure_interface(
+                "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+                config_base_dir=str(tmp_path),
+            )
+        network_ops.NetNS.assert_called_once_with("ns_ct", flags=0)
+
+    def test_close_all_netlink_closes_sockets(self, netlink, tmp_path):
+        """Verify cached sockets are closed and dropped."""
+        configure_interface(
+            "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+            config_base_dir=str(tmp_path),
+        )
+        network_ops._close_all_netlink()
+        netlink["ns_ct"].close.assert_called_once()
+        assert network_ops._NL_SOCKETS == {}
+
+    def test_missing_device_raises(self, netlink, tmp_path):
+        """Verify a missing device is reported instead of silently skipped."""
+        network_ops._get_netns_socket("ns_ct").link_lookup.return_value = []
+        with pytest.raises(ValueError, match="not found"):
+            configure_interface(
+                "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+                config_base_dir=str(tmp_path),
+            )
+
+    def test_missing_device_evicts_cached_socket(self, netlink, tmp_path):
+        """Verify a stale socket (device not found) is reopened on the next call."""
+        stale = network_ops._get_netns_socket("ns_ct")
+        stale.link_lookup.return_value = []
+        with pytest.raises(ValueError, match="not found"):
+            configure_interface(
+                "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+                config_base_dir=str(tmp_path),
+            )
+        stale.close.assert_called_once()
+        assert "ns_ct" not in network_ops._NL_SOCKETS
+
+        result = configure_interface(
+            "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+            config_base_dir=str(tmp_path),
+        )
+        assert result["status"] == "success"
+        assert network_ops.NetNS.call_count == 2
+
+    def test_missing_namespace_is_not_created(self, netlink, tmp_path):
+        """Verify a missing namespace raises instead of being created empty."""
+        network_ops.NetNS.side_effect = FileNotFoundError("ns_ct")
+        with pytest.raises(FileNotFoundError):
+            configure_interface(
+                "CT", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+                config_base_dir=str(tmp_path),
+            )
+        network_ops.NetNS.assert_called_once_with("ns_ct", flags=0)
+        assert "ns_ct" not in network_ops._NL_SOCKETS
+        assert not (tmp_path / "ns_ct").exists()
+
+
 # ---------------------------------------------------------------------------
 # Task 2.4: Namespace isolation verification
 # ---------------------------------------------------------------------------
@@ -279,41 +478,39 @@ class TestConfigureInterface:
 class TestVerifyIsolationAfterConfig:
     """Tests for isolation verification after configuration (Task 2.4)."""
 
+    @staticmethod
+    def _make_runner(stdout: str, returncode: int = 0):
+        """Create a mock runner returning the given nft output."""
+        return Mock(
+            spec=subprocess.run,
+            return_value=subprocess.CompletedProcess(
+                args=[], returncode=returncode, stdout=stdout
+            ),
+        )
+
     def test_isolation_passes_when_rules_present(self):
         """Verify pass when nftables rules contain policy drop."""
-        runner = MagicMock()
-        runner.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="chain forward { policy drop; }"
-        )
+        runner = self._make_runner("chain forward { policy drop; }")
         result = verify_isolation_after_config(runner=runner)
         assert result["status"] == "pass"
 
     def test_isolation_fails_when_nft_command_fails(self):
         """Verify fail when nft list command returns non-zero."""
-        runner = MagicMock()
-        runner.return_value = subprocess.CompletedProcess(
-            args=[], returncode=1, stdout=""
-        )
+        runner = self._make_runner("", returncode=1)
         result = verify_isolation_after_config(runner=runner)
         assert result["status"] == "fail"
         assert "missing" in result["message"]
 
     def test_isolation_fails_when_policy_not_drop(self):
         """Verify fail when forward policy is not drop."""
-        runner = MagicMock()
-        runner.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="chain forward { policy accept; }"
-        )
+        runner = self._make_runner("chain forward { policy accept; }")
         result = verify_isolation_after_config(runner=runner)
         assert result["status"] == "fail"
         assert "policy" in result["message"]
 
     def test_isolation_checks_default_and_ns_pt(self):
         """Verify both default and ns_pt namespaces are checked."""
-        runner = MagicMock()
-        runner.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="chain forward { policy drop; }"
-        )
+        runner = self._make_runner("chain forward { policy drop; }")
         verify_isolation_after_config(runner=runner)
         calls = runner.call_args_list
         # First call should be for default namespace (no "ip netns exec")
@@ -322,6 +519,66 @@ class TestVerifyIsolationAfterConfig:
         assert "ns_pt" in calls[1][0][0]
 
 
+class TestVerifyIsolationLibnftables:
+    """Tests for the libnftables path used when no runner is injected."""
+
+    def _install_nft(self, monkeypatch, rc=0, policy="drop"):
+        """Replace Nftables with a fake returning a JSON chain listing."""
+        entered = []
+        entered_threads = self.entered_threads = []
+
+        class FakeNftables:
+            def set_json_output(self, value):
+                assert value is True
+
+            def cmd(self, command):
+                assert command == "list chain inet isolation forward"
+                chain = {"family": "inet", "table": "isolation", "name": "forward"}
+                if policy is not None:
+                    chain["policy"] = policy
+                output = json.dumps({"nftables": [{"metainfo": {}}, {"chain": chain}]})
+                return rc, output if rc == 0 else "", ""
+
+        @contextlib.contextmanager
+        def fake_enter_netns(namespace):
+            entered.append(namespace)
+            entered_threads.append(threading.current_thread())
+            yield
+
+        monkeypatch.setattr(network_ops, "Nftables", FakeNftables)
+        monkeypatch.setattr(network_ops, "_enter_netns", fake_enter_netns)
+        monkeypatch.setattr(network_ops.subprocess, "run", MagicMock())
+        return entered
+
+    def test_passes_when_policy_drop(self, monkeypatch):
+        """Verify pass when both namespaces report a drop policy."""
+        entered = self._install_nft(monkeypatch)
+        result = verify_isolation_after_config()
+        assert result["status"] == "pass"
+        assert entered == ["ns_pt"]
+
+    def test_enters_namespace_on_worker_thread(self, monkeypatch):
+        """Verify setns never runs on the calling (request-handling) thread."""
+        self._install_nft(monkeypatch)
+        verify_isolation_after_config()
+        assert len(self.entered_threads) == 1
+        assert self.entered_threads[0] is not threading.current_thread()
+
+    def test_fails_when_chain_missing(self, monkeypatch):
+        """Verify fail when libnftables cannot list the chain."""
+        self._install_nft(monkeypatch, rc=1)
+        result = verify_isolation_after_config()
+        assert result["status"] == "fail"
+        assert "missing in default" in result["message"]
+
+    def test_fails_when_policy_not_drop(self, monkeypatch):
+        """Verify fail when the forward policy is accept."""
+        self._install_nft(monkeypatch, policy="accept")
+        result = verify_isolation_after_config()
+        assert result["status"] == "fail"
+        assert "policy" in result["message"]
+
+
 # ---------------------------------------------------------------------------
 # Task 2.5: IPC command handler
 # ---------------------------------------------------------------------------
@@ -431,6 +688,14 @@ class TestWriteNetnsConfig:
         assert "10.0.0.1/24" in content
         assert "192.168.10.1" not in content
 
+    def test_leaves_no_temp_file(self, tmp_path):
+        """Verify the atomic write does not leave its temp file behind."""
+        write_netns_config(
+            "ns_ct", "eth1", "192.168.10.1", "255.255.255.0", "192.168.10.254",
+            base_dir=str(tmp_path),
+        )
+        assert [p.name for p in (tmp_path / "ns_ct" / "network").iterdir()] == ["eth1"]
+
 
 # ---------------------------------------------------------------------------
 # Task 3.5: Rollback on failure
@@ -481,30 +746,37 @@ class TestInterfaceServiceRollback:
 # ---------------------------------------------------------------------------
 
 
+PROC_NET_DEV_CT = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
+    "    lo:       0       0    0    0    0     0          0         0        0       0    0    0    0     0       0          0\n"
+    "  eth1: 1024000    1500    2    0    0     0          0         0  2048000    2000    1    0    0     0       0          0\n"
+)
+
+PROC_NET_DEV_PT = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
+    "    lo:       0       0    0    0    0     0          0         0        0       0    0    0    0     0       0          0\n"
+    "  eth2:  512000     750    0    0    0     0          0         0   768000    1000    0    0    0     0       0          0\n"
+)
+
+PROC_NET_DEV_MGMT = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
+    "    lo:       0       0    0    0    0     0          0         0        0       0    0    0    0     0       0          0\n"
+    "  eth0:  256000     500    0    0    0     0          0         0   128000     300    0    0    0     0       0          0\n"
+)
+
+_PROC_NET_DEV_OUTPUTS = {
+    "ns_ct": PROC_NET_DEV_CT,
+    "ns_pt": PROC_NET_DEV_PT,
+    "ns_mgmt": PROC_NET_DEV_MGMT,
+}
+
+
 class TestGetInterfaceStats:
     """Tests for get_interface_stats (Story 5.1, Task 2)."""
 
-    PROC_NET_DEV_CT = (
-        "Inter-|   Receive                                                |  Transmit\n"
-        " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
-        "    lo:       0       0    0    0    0     0          0         0        0       0    0    0    0     0       0          0\n"
-        "  eth1: 1024000    1500    2    0    0     0          0         0  2048000    2000    1    0    0     0       0          0\n"
-    )
-
-    PROC_NET_DEV_PT = (
-        "Inter-|   Receive                                                |  Transmit\n"
-        " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
-        "    lo:       0       0    0    0    0     0          0         0        0       0    0    0    0     0       0          0\n"
-        "  eth2:  512000     750    0    0    0     0          0         0   768000    1000    0    0    0     0       0          0\n"
-    )
-
-    PROC_NET_DEV_MGMT = (
-        "Inter-|   Receive                                                |  Transmit\n"
-        " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
-        "    lo:       0       0    0    0    0     0          0         0        0       0    0    0    0     0       0          0\n"
-        "  eth0:  256000     500    0    0    0     0          0         0   128000     300    0    0    0     0       0          0\n"
-    )
-
     def _make_runner(self, outputs: dict[str, str]):
         """Create a mock runner that returns namespace-specific /proc/net/dev."""
         def mock_runner(*args, **kwargs):
@@ -521,11 +793,7 @@ class TestGetInterfaceStats:
 
     def test_returns_stats_for_all_interfaces(self) -> None:
         """Verify stats returned for CT, PT, MGMT (AC: #2, #7)."""
-        runner = self._make_runner({
-            "ns_ct": self.PROC_NET_DEV_CT,
-            "ns_pt": self.PROC_NET_DEV_PT,
-            "ns_mgmt": self.PROC_NET_DEV_MGMT,
-        })
+        runner = self._make_runner(_PROC_NET_DEV_OUTPUTS)
         result = get_interface_stats(runner=runner)
         assert "CT" in result
         assert "PT" in result
@@ -533,11 +801,7 @@ class TestGetInterfaceStats:
 
     def test_ct_stats_parsed_correctly(self) -> None:
         """Verify CT interface stats match /proc/net/dev values (AC: #7)."""
-        runner = self._make_runner({
-            "ns_ct": self.PROC_NET_DEV_CT,
-            "ns_pt": self.PROC_NET_DEV_PT,
-            "ns_mgmt": self.PROC_NET_DEV_MGMT,
-        })
+        runner = self._make_runner(_PROC_NET_DEV_OUTPUTS)
         result = get_interface_stats(runner=runner)
         ct = result["CT"]
         assert ct["bytesRx"] == 1024000
@@ -549,11 +813,7 @@ class TestGetInterfaceStats:
 
     def test_stats_include_all_required_fields(self) -> None:
         """Verify all required stat fields are present (AC: #7)."""
-        runner = self._make_runner({
-            "ns_ct": self.PROC_NET_DEV_CT,
-            "ns_pt": self.PROC_NET_DEV_PT,
-            "ns_mgmt": self.PROC_NET_DEV_MGMT,
-        })
+        runner = self._make_runner(_PROC_NET_DEV_OUTPUTS)
         result = get_interface_stats(runner=runner)
         required_fields = {"bytesRx", "bytesTx", "packetsRx", "packetsTx", "errorsRx", "errorsTx"}
         for iface in ("CT", "PT", "MGMT"):
@@ -595,7 +855,33 @@ class TestGetInterfaceStats:
             cmd = args[0]
             if "netns" in cmd:
                 called_namespaces.append(cmd[3])
-            return subprocess.CompletedProcess(cmd, 0, stdout=self.PROC_NET_DEV_CT, stderr="")
+            return subprocess.CompletedProcess(cmd, 0, stdout=PROC_NET_DEV_CT, stderr="")
 
         get_interface_stats(runner=mock_runner)
         assert set(called_namespaces) == {"ns_ct", "ns_pt", "ns_mgmt"}
+
+    def test_default_reads_stats_in_namespace_without_spawning(self, monkeypatch) -> None:
+        """Verify the default path reads /proc/net/dev via setns, not ip netns exec."""
+        spawn = MagicMock()
+        monkeypatch.setattr(
+            network_ops, "_read_proc_net_dev_in_netns", _PROC_NET_DEV_OUTPUTS.__getitem__
+        )
+        monkeypatch.setattr(network_ops.subprocess, "run", spawn)
+
+        result = get_interface_stats()
+        assert result["CT"]["bytesRx"] == 1024000
+        assert result["PT"]["bytesTx"] == 768000
+        assert result["MGMT"]["packetsTx"] == 300
+        spawn.assert_not_called()
+
+    def test_default_falls_back_to_ip_netns_exec(self, monkeypatch) -> None:
+        """Verify stats fall back to ip netns exec when setns is not possible."""
+        def failing_reader(namespace):
+            raise OSError("setns not permitted")
+
+        monkeypatch.setattr(network_ops, "_read_proc_net_dev_in_netns", failing_reader)
+        monkeypatch.setattr(network_ops.subprocess, "run", self._make_runner(_PROC_NET_DEV_OUTPUTS))
+
+        result = get_interface_stats()
+        assert result["CT"]["bytesRx"] == 1024000
+        assert result["PT"]["bytesRx"] == 512000
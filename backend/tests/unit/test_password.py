@@ -52,3 +52,38 @@ class TestPasswordHashing:
         hashed = hash_password("admin")
         result = needs_rehash(hashed)
         assert isinstance(result, bool)
+
+
+class TestVerifyPasswordCache:
+    """Tests for the optional verify_password memoization."""
+
+    @pytest.fixture
+    def settings(self):
+        from backend.app.auth import password
+        from backend.app.config import get_settings
+
+        settings = get_settings()
+        password._verify_password_cached.cache_clear()
+        yield settings
+        password._verify_password_cached.cache_clear()
+
+    def test_cache_disabled_by_default(self, settings):
+        """Test verify_password re-runs argon2 when caching is off."""
+        from backend.app.auth import password
+
+        hashed = password.hash_password("admin")
+        assert password.verify_password("admin", hashed) is True
+        assert password._verify_password_cached.cache_info().currsize == 0
+
+    def test_cache_reuses_result_when_enabled(self, settings, monkeypatch):
+        """Test repeated verifications hit the cache when enabled."""
+        from backend.app.auth import password
+
+        monkeypatch.setattr(settings, "password_verify_cache", True)
+        hashed = password.hash_password("admin")
+
+        assert password.verify_password("admin", hashed) is True
+        assert password.verify_password("admin", hashed) is True
+        assert password.verify_password("wrong", hashed) is False
+        info = password._verify_password_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
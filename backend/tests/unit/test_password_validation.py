@@ -51,19 +51,23 @@ class TestPasswordComplexity:
         assert msg == ""
 
 
+@pytest.fixture(scope="module")
+def current_hash():
+    """Hash of the current password, computed once for the module."""
+    return hash_password("samepass123")
+
+
 class TestPasswordNotReused:
     """Tests for password reuse detection."""
 
-    def test_different_password_passes(self):
+    def test_different_password_passes(self, current_hash):
         """Test new password different from current passes."""
-        current_hash = hash_password("oldpass123")
         is_valid, msg = validate_password_not_reused("newpass456", current_hash)
         assert is_valid is True
         assert msg == ""
 
-    def test_same_password_fails(self):
+    def test_same_password_fails(self, current_hash):
         """Test reusing same password fails."""
-        current_hash = hash_password("samepass123")
         is_valid, msg = validate_password_not_reused("samepass123", current_hash)
         assert is_valid is False
         assert "different from current" in msg
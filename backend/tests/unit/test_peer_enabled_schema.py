@@ -3,17 +3,38 @@
 Tests that enabled field is properly included in all peer schemas.
 """
 
+from datetime import datetime
+
 import pytest
 from pydantic import ValidationError
 
+from backend.app.schemas.ipsec_peer import (
+    PeerCreateRequest,
+    PeerResponse,
+    PeerUpdateRequest,
+)
+
+
+@pytest.fixture(scope="module")
+def peer_response_payload():
+    """PeerResponse fields with fixed timestamps."""
+    return {
+        "peerId": 1,
+        "name": "test-peer",
+        "remoteIp": "10.0.0.1",
+        "ikeVersion": "ikev2",
+        "enabled": True,
+        "createdAt": datetime(2024, 1, 1),
+        "updatedAt": datetime(2024, 1, 1),
+        "operationalStatus": "ready"
+    }
+
 
 class TestPeerEnabledSchema:
     """Tests for enabled field in peer schemas."""
 
     def test_peer_create_request_accepts_enabled(self):
         """Test PeerCreateRequest accepts enabled field."""
-        from backend.app.schemas.ipsec_peer import PeerCreateRequest
-
         # Should accept enabled=True
         peer_data = {
             "name": "test-peer",
@@ -32,8 +53,6 @@ class TestPeerEnabledSchema:
 
     def test_peer_create_request_enabled_defaults_to_true(self):
         """Test PeerCreateRequest enabled defaults to True when not provided."""
-        from backend.app.schemas.ipsec_peer import PeerCreateRequest
-
         peer_data = {
             "name": "test-peer",
             "remoteIp": "10.0.0.1",
@@ -45,8 +64,6 @@ class TestPeerEnabledSchema:
 
     def test_peer_update_request_accepts_enabled(self):
         """Test PeerUpdateRequest accepts enabled field."""
-        from backend.app.schemas.ipsec_peer import PeerUpdateRequest
-
         # Should accept enabled=True
         peer = PeerUpdateRequest(enabled=True)
         assert peer.enabled is True
@@ -59,21 +76,8 @@ class TestPeerEnabledSchema:
         peer = PeerUpdateRequest()
         assert peer.enabled is None
 
-    def test_peer_response_includes_enabled(self):
+    def test_peer_response_includes_enabled(self, peer_response_payload):
         """Test PeerResponse includes enabled field."""
-        from backend.app.schemas.ipsec_peer import PeerResponse
-        from datetime import datetime
-
-        response_data = {
-            "peerId": 1,
-            "name": "test-peer",
-            "remoteIp": "10.0.0.1",
-            "ikeVersion": "ikev2",
-            "enabled": True,
-            "createdAt": datetime.now(),
-            "updatedAt": datetime.now(),
-            "operationalStatus": "ready"
-        }
-        response = PeerResponse(**response_data)
+        response = PeerResponse(**peer_response_payload)
         assert response.enabled is True
         assert hasattr(response, "enabled")
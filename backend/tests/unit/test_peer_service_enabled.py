@@ -3,31 +3,27 @@
 Tests that create_peer and update_peer properly handle the enabled field.
 """
 
-import os
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-# Set test environment variables
-os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
-os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
-
-from backend.app.db.base import Base
 from backend.app.models.peer import Peer
 from backend.app.services.ipsec_peer_service import create_peer, update_peer
 
 
 @pytest.fixture
-def db_session():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
-
-
+def seeded_peer(db_session, request):
+    """Create a peer whose enabled state is given by the fixture param."""
+    enabled = request.param
+    return create_peer(
+        session=db_session,
+        name=f"peer-{'enabled' if enabled else 'disabled'}",
+        remote_ip="10.0.0.1",
+        psk_plaintext="test-psk",
+        ike_version="ikev2",
+        enabled=enabled
+    )
+
+
+@pytest.mark.db
 class TestPeerServiceEnabled:
     """Tests for enabled field in peer service functions."""
 
@@ -71,72 +67,33 @@ class TestPeerServiceEnabled:
 
         assert peer.enabled is True
 
-    def test_update_peer_can_disable(self, db_session):
-        """Test updating a peer to set enabled=False."""
-        # Create an enabled peer
-        peer = create_peer(
-            session=db_session,
-            name="test-peer",
-            remote_ip="10.0.0.4",
-            psk_plaintext="test-psk",
-            ike_version="ikev2",
-            enabled=True
-        )
+    @pytest.mark.parametrize(
+        "seeded_peer", [True, False], ids=["disable", "enable"], indirect=True
+    )
+    def test_update_peer_toggles_enabled(self, db_session, seeded_peer):
+        """Test updating a peer flips its enabled state."""
+        was_enabled = seeded_peer.enabled
 
-        assert peer.enabled is True
-
-        # Disable the peer
         updated_peer = update_peer(
             session=db_session,
-            peer=peer,
-            enabled=False
+            peer=seeded_peer,
+            enabled=not was_enabled
         )
 
-        assert updated_peer.enabled is False
-        assert updated_peer.peerId == peer.peerId
+        assert updated_peer.enabled is (not was_enabled)
+        assert updated_peer.peerId == seeded_peer.peerId
 
-    def test_update_peer_can_enable(self, db_session):
-        """Test updating a peer to set enabled=True."""
-        # Create a disabled peer
-        peer = create_peer(
-            session=db_session,
-            name="test-peer-2",
-            remote_ip="10.0.0.5",
-            psk_plaintext="test-psk",
-            ike_version="ikev2",
-            enabled=False
-        )
-
-        assert peer.enabled is False
-
-        # Enable the peer
-        updated_peer = update_peer(
-            session=db_session,
-            peer=peer,
-            enabled=True
-        )
-
-        assert updated_peer.enabled is True
-        assert updated_peer.peerId == peer.peerId
-
-    def test_update_peer_enabled_none_does_not_change(self, db_session):
+    @pytest.mark.parametrize("seeded_peer", [True, False], indirect=True)
+    def test_update_peer_enabled_none_does_not_change(self, db_session, seeded_peer):
         """Test that update_peer with enabled=None does not change the enabled state."""
-        # Create an enabled peer
-        peer = create_peer(
-            session=db_session,
-            name="test-peer-3",
-            remote_ip="10.0.0.6",
-            psk_plaintext="test-psk",
-            ike_version="ikev2",
-            enabled=True
-        )
+        was_enabled = seeded_peer.enabled
 
         # Update other fields but not enabled
         updated_peer = update_peer(
             session=db_session,
-            peer=peer,
-            name="updated-peer-3"
+            peer=seeded_peer,
+            name="updated-peer"
         )
 
-        assert updated_peer.enabled is True
-        assert updated_peer.name == "updated-peer-3"
+        assert updated_peer.enabled is was_enabled
+        assert updated_peer.name == "updated-peer"
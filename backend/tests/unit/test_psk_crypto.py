@@ -1,15 +1,19 @@
 """Unit tests for PSK encryption service (Story 4.2, Task 2)."""
 
-import os
-
 import pytest
 
-os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
-os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
+from backend.app.services.psk_crypto import _get_fernet, decrypt_psk, encrypt_psk
 
-from backend.app.services.psk_crypto import decrypt_psk, encrypt_psk
+# Empty, long, special-character and unicode PSKs
+EDGE_CASE_PSKS = [
+    "",
+    "a" * 256,
+    "p@$$w0rd!#%^&*()_+-=[]{}|;':\",./<>?",
+    "test-key-\u2603-\u00e9\u00e8",
+]
 
 
+@pytest.mark.crypto
 class TestPSKCrypto:
     """Test PSK encryption and decryption."""
 
@@ -37,23 +41,9 @@ class TestPSKCrypto:
         assert decrypt_psk(encrypted1) == psk
         assert decrypt_psk(encrypted2) == psk
 
-    def test_encrypt_empty_psk_roundtrip(self) -> None:
-        """Verify empty string can be encrypted and decrypted."""
-        psk = ""
-        encrypted = encrypt_psk(psk)
-        assert decrypt_psk(encrypted) == psk
-
-    def test_encrypt_long_psk_roundtrip(self) -> None:
-        """Verify long PSK can be encrypted and decrypted."""
-        psk = "a" * 256
-        encrypted = encrypt_psk(psk)
-        assert decrypt_psk(encrypted) == psk
-
-    def test_encrypt_special_chars_roundtrip(self) -> None:
-        """Verify PSK with special characters roundtrips correctly."""
-        psk = "p@$$w0rd!#%^&*()_+-=[]{}|;':\",./<>?"
-        encrypted = encrypt_psk(psk)
-        assert decrypt_psk(encrypted) == psk
+    def test_encrypt_roundtrip(self) -> None:
+        """Verify edge-case PSKs can be encrypted and decrypted."""
+        assert list(map(decrypt_psk, map(encrypt_psk, EDGE_CASE_PSKS))) == EDGE_CASE_PSKS
 
     def test_encrypted_output_is_string(self) -> None:
         """Verify encrypt_psk returns a string (suitable for database storage)."""
@@ -65,8 +55,6 @@ class TestPSKCrypto:
         with pytest.raises(Exception):
             decrypt_psk("not-valid-encrypted-data")
 
-    def test_encrypt_unicode_psk_roundtrip(self) -> None:
-        """Verify PSK with unicode characters roundtrips correctly."""
-        psk = "test-key-\u2603-\u00e9\u00e8"
-        encrypted = encrypt_psk(psk)
-        assert decrypt_psk(encrypted) == psk
+    def test_fernet_instance_is_reused(self) -> None:
+        """Verify the Fernet cipher is built once per configured key."""
+        assert _get_fernet() is _get_fernet()
@@ -1,12 +1,10 @@
-from pathlib import Path
+import pytest
 
+pytestmark = pytest.mark.docs
 
-def test_security_artifacts_placeholders_listed() -> None:
-    repo_root = Path(__file__).resolve().parents[3]
-    readme_path = repo_root / "docs" / "security" / "README.md"
 
-    assert readme_path.exists(), "docs/security/README.md must exist"
-    content = readme_path.read_text(encoding="utf-8")
+def test_security_artifacts_placeholders_listed(security_docs) -> None:
+    content = security_docs["security_readme"]
 
     for token in ["nmap-", "zap-", "sqlmap-"]:
         assert token in content, f"Missing artifact placeholder: {token}"
@@ -1,12 +1,10 @@
-from pathlib import Path
+import pytest
 
+pytestmark = pytest.mark.docs
 
-def test_security_report_scope_and_environment_sections() -> None:
-    repo_root = Path(__file__).resolve().parents[3]
-    report_path = repo_root / "docs" / "security-report.md"
 
-    assert report_path.exists(), "docs/security-report.md must exist"
-    content = report_path.read_text(encoding="utf-8")
+def test_security_report_scope_and_environment_sections(security_docs) -> None:
+    content = security_docs["report"]
 
     required_sections = [
         "## Scope",
@@ -15,14 +13,17 @@ def test_security_report_scope_and_environment_sections() -> None:
         "## Environment",
         "### Build and Configuration",
     ]
-    for section in required_sections:
-        assert section in content, f"Missing section: {section}"
+    missing = [section for section in required_sections if section not in content]
+    assert not missing, f"Missing sections: {missing}"
 
-    for token in ["MGMT interface", "REST API", "Web UI", "WebSocket"]:
-        assert token in content, f"Missing target surface: {token}"
+    surfaces = ["MGMT interface", "REST API", "Web UI", "WebSocket"]
+    missing = [token for token in surfaces if token not in content]
+    assert not missing, f"Missing target surfaces: {missing}"
 
-    for token in ["non-destructive", "lab-only"]:
-        assert token in content, f"Missing constraint: {token}"
+    constraints = ["non-destructive", "lab-only"]
+    missing = [token for token in constraints if token not in content]
+    assert not missing, f"Missing constraints: {missing}"
 
-    for token in ["Build ID", "Image SHA", "Configuration"]:
-        assert token in content, f"Missing build metadata field: {token}"
+    build_fields = ["Build ID", "Image SHA", "Configuration"]
+    missing = [token for token in build_fields if token not in content]
+    assert not missing, f"Missing build metadata fields: {missing}"
@@ -1,14 +1,12 @@
-from pathlib import Path
+import pytest
 
+pytestmark = pytest.mark.docs
 
-def test_security_report_contains_required_sections_and_links() -> None:
-    repo_root = Path(__file__).resolve().parents[3]
-    report_path = repo_root / "docs" / "security-report.md"
-    docs_readme = repo_root / "docs" / "README.md"
-    root_readme = repo_root / "README.md"
 
-    report = report_path.read_text(encoding="utf-8")
-    for section in [
+def test_security_report_contains_required_sections_and_links(security_docs) -> None:
+    report = security_docs["report"]
+
+    required_sections = [
         "## Methodology",
         "## Tools and Versions",
         "## Results Summary",
@@ -17,17 +15,19 @@ def test_security_report_contains_required_sections_and_links() -> None:
         "## Risks and Limitations",
         "## Remediation Log",
         "## Raw Artifacts",
-    ]:
-        assert section in report, f"Missing section: {section}"
+    ]
+    missing = [section for section in required_sections if section not in report]
+    assert not missing, f"Missing sections: {missing}"
 
-    for token in [
+    required_tokens = [
         "V1.0",
         "critical",
         "release is blocked",
         "docs/security/README.md",
         "docs/security/scan-results-placeholder.md",
-    ]:
-        assert token in report, f"Missing report token: {token}"
+    ]
+    missing = [token for token in required_tokens if token not in report]
+    assert not missing, f"Missing report tokens: {missing}"
 
-    assert "security-report.md" in docs_readme.read_text(encoding="utf-8")
-    assert "docs/security-report.md" in root_readme.read_text(encoding="utf-8")
+    assert "security-report.md" in security_docs["docs_readme"]
+    assert "docs/security-report.md" in security_docs["root_readme"]
@@ -1,16 +1,19 @@
 """Unit tests for strongSwan configuration operations (Story 4.2 & 4.3)."""
 
-import os
 import subprocess
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import Mock
 
-os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
-os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
+import pytest
+from pyfakefs.helpers import reset_ids, set_uid
 
 from backend.daemon.ops.strongswan_ops import (
     _sanitize_name,
     configure_peer,
     generate_swanctl_config,
     get_tunnel_status,
+    get_tunnel_telemetry,
     initiate_peer,
     reload_peer_config,
     remove_peer_config,
@@ -19,6 +22,61 @@ from backend.daemon.ops.strongswan_ops import (
     write_routes_config,
 )
 
+# Canned swanctl outcomes shared by the command-runner tests
+_OK_RESULT = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+_ALREADY_RESULT = subprocess.CompletedProcess(
+    [], 0, stdout="", stderr="CHILD_SA already INSTALLED"
+)
+_ALREADY_FAILED_RESULT = subprocess.CompletedProcess(
+    [], 1, stdout="", stderr="CHILD_SA already INSTALLED"
+)
+_PERMISSION_DENIED_RESULT = subprocess.CompletedProcess(
+    [], 1, stdout="", stderr="permission denied"
+)
+_NO_MATCH_RESULT = subprocess.CompletedProcess(
+    [], 1, stdout="", stderr="no matching connection"
+)
+_TIMEOUT_EXC = subprocess.TimeoutExpired(cmd="swanctl", timeout=5)
+_NOT_FOUND_EXC = FileNotFoundError("swanctl not found")
+
+_PEER_IDS = MappingProxyType({
+    "site-a": 1,
+    "site-b": 2,
+    "peer-x": 3,
+    "gone-peer": 4,
+})
+
+
+def _lookup_peer_ids(names):
+    """Peer name lookup for the status/telemetry tests; unknown names miss."""
+    return {n: _PEER_IDS[n] for n in names if n in _PEER_IDS}
+
+
+@pytest.fixture
+def conf_dir(fs) -> Path:
+    """swanctl config directory on an in-memory filesystem."""
+    fs.create_dir("/etc/swanctl/conf.d")
+    return Path("/etc/swanctl/conf.d")
+
+
+@pytest.fixture
+def non_root_user():
+    """Enforce file permissions on the fake filesystem, even as root.
+
+    Request it before conf_dir so the directory is owned by the fake user.
+    """
+    set_uid(1000)
+    yield
+    reset_ids()
+
+
+@pytest.fixture(scope="session")
+def default_config() -> str:
+    """Config for a peer with no optional settings, rendered once."""
+    return generate_swanctl_config(
+        name="test", remote_ip="10.0.0.1", psk="x", ike_version="ikev2"
+    )
+
 
 class TestGenerateSwanctlConfig:
     """Tests for strongSwan config generation."""
@@ -68,23 +126,13 @@ class TestGenerateSwanctlConfig:
         )
         assert "rekey_time = 7200s" in config
 
-    def test_includes_connections_block(self) -> None:
-        config = generate_swanctl_config(
-            name="test", remote_ip="10.0.0.1", psk="x", ike_version="ikev2"
-        )
-        assert "connections {" in config
-
-    def test_includes_secrets_block(self) -> None:
-        config = generate_swanctl_config(
-            name="test", remote_ip="10.0.0.1", psk="x", ike_version="ikev2"
-        )
-        assert "secrets {" in config
-
-    def test_includes_child_tunnel_mode(self) -> None:
-        config = generate_swanctl_config(
-            name="test", remote_ip="10.0.0.1", psk="x", ike_version="ikev2"
-        )
-        assert "mode = tunnel" in config
+    @pytest.mark.parametrize(
+        "needle",
+        ["connections {", "secrets {", "mode = tunnel"],
+        ids=["connections_block", "secrets_block", "child_tunnel_mode"],
+    )
+    def test_includes_block(self, default_config, needle) -> None:
+        assert needle in default_config
 
     def test_includes_if_id_when_peer_id_provided(self) -> None:
         config = generate_swanctl_config(
@@ -97,15 +145,9 @@ class TestGenerateSwanctlConfig:
         assert "if_id_in = 7" in config
         assert "if_id_out = 7" in config
 
-    def test_no_if_id_when_peer_id_omitted(self) -> None:
-        config = generate_swanctl_config(
-            name="no-xfrm",
-            remote_ip="10.5.5.5",
-            psk="psk",
-            ike_version="ikev2",
-        )
-        assert "if_id_in" not in config
-        assert "if_id_out" not in config
+    def test_no_if_id_when_peer_id_omitted(self, default_config) -> None:
+        assert "if_id_in" not in default_config
+        assert "if_id_out" not in default_config
 
     def test_includes_local_ts_when_provided(self) -> None:
         config = generate_swanctl_config(
@@ -127,25 +169,16 @@ class TestGenerateSwanctlConfig:
         )
         assert "remote_ts = 192.168.1.0/24,10.0.0.0/8" in config
 
-    def test_no_ts_when_omitted(self) -> None:
-        config = generate_swanctl_config(
-            name="no-ts",
-            remote_ip="10.5.5.5",
-            psk="psk",
-            ike_version="ikev2",
-        )
-        assert "local_ts" not in config
-        assert "remote_ts" not in config
+    def test_no_ts_when_omitted(self, default_config) -> None:
+        assert "local_ts" not in default_config
+        assert "remote_ts" not in default_config
 
 
 class TestValidateSwanctlSyntax:
     """Tests for config syntax validation."""
 
-    def test_valid_config_passes(self) -> None:
-        config = generate_swanctl_config(
-            name="test", remote_ip="10.0.0.1", psk="x", ike_version="ikev2"
-        )
-        valid, msg = validate_swanctl_syntax(config)
+    def test_valid_config_passes(self, default_config) -> None:
+        valid, msg = validate_swanctl_syntax(default_config)
         assert valid is True
 
     def test_brace_mismatch_fails(self) -> None:
@@ -164,30 +197,30 @@ class TestValidateSwanctlSyntax:
 class TestConfigurePeer:
     """Tests for the full configure_peer flow."""
 
-    def test_configure_peer_writes_config_file(self, tmp_path) -> None:
+    def test_configure_peer_writes_config_file(self, conf_dir) -> None:
         result = configure_peer(
             name="test-peer",
             remote_ip="10.1.1.1",
             psk="secret",
             ike_version="ikev2",
-            conf_dir=str(tmp_path),
+            conf_dir=str(conf_dir),
         )
 
         assert result["status"] == "success"
-        config_file = tmp_path / "test-peer.conf"
+        config_file = conf_dir / "test-peer.conf"
         assert config_file.exists()
 
         content = config_file.read_text()
         assert "remote_addrs = 10.1.1.1" in content
         assert 'secret = "secret"' in content
 
-    def test_configure_peer_returns_config_path(self, tmp_path) -> None:
+    def test_configure_peer_returns_config_path(self, conf_dir) -> None:
         result = configure_peer(
             name="path-peer",
             remote_ip="10.2.2.2",
             psk="psk",
             ike_version="ikev2",
-            conf_dir=str(tmp_path),
+            conf_dir=str(conf_dir),
         )
 
         assert "config_file" in result
@@ -197,52 +230,17 @@ class TestConfigurePeer:
 class TestInitiatePeer:
     """Tests for tunnel initiation (Story 5.2, Task 1)."""
 
-    def test_initiate_success(self) -> None:
-        """Verify successful initiation returns success (AC: #1)."""
-        def mock_runner(*args, **kwargs):
-            result = subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-            return result
-
-        result = initiate_peer(name="test-peer", runner=mock_runner)
-        assert result["status"] == "success"
-        assert "initiated" in result["message"].lower()
-
     def test_initiate_already_established(self) -> None:
         """Verify initiation is idempotent when tunnel already up (AC: #10)."""
-        def mock_runner(*args, **kwargs):
-            result = subprocess.CompletedProcess(
-                args[0], 0, stdout="", stderr="CHILD_SA already INSTALLED"
-            )
-            return result
+        mock_runner = Mock(spec=subprocess.run, return_value=_ALREADY_RESULT)
 
         result = initiate_peer(name="existing-peer", runner=mock_runner)
         assert result["status"] == "success"
         assert "already" in result["message"].lower()
 
-    def test_initiate_timeout(self) -> None:
-        """Verify initiation handles timeout gracefully (AC: #3, Task 1.4)."""
-        def mock_runner(*args, **kwargs):
-            raise subprocess.TimeoutExpired(cmd="swanctl", timeout=5)
-
-        result = initiate_peer(name="timeout-peer", runner=mock_runner)
-        assert result["status"] == "warning"
-        assert "timed out" in result["message"].lower()
-
-    def test_initiate_swanctl_not_found(self) -> None:
-        """Verify initiation handles missing swanctl gracefully (AC: #3, Task 1.4)."""
-        def mock_runner(*args, **kwargs):
-            raise FileNotFoundError("swanctl not found")
-
-        result = initiate_peer(name="nobin-peer", runner=mock_runner)
-        assert result["status"] == "warning"
-        assert "not available" in result["message"].lower()
-
     def test_initiate_nonzero_returncode_is_error(self) -> None:
         """Verify non-zero return code yields error status."""
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(
-                args[0], 1, stdout="", stderr="permission denied"
-            )
+        mock_runner = Mock(spec=subprocess.run, return_value=_PERMISSION_DENIED_RESULT)
 
         result = initiate_peer(name="bad-peer", runner=mock_runner)
         assert result["status"] == "error"
@@ -250,10 +248,7 @@ class TestInitiatePeer:
 
     def test_initiate_nonzero_already_established_is_success(self) -> None:
         """Verify non-zero return code with already-established message is idempotent."""
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(
-                args[0], 1, stdout="", stderr="CHILD_SA already INSTALLED"
-            )
+        mock_runner = Mock(spec=subprocess.run, return_value=_ALREADY_FAILED_RESULT)
 
         result = initiate_peer(name="existing-peer", runner=mock_runner)
         assert result["status"] == "success"
@@ -261,102 +256,95 @@ class TestInitiatePeer:
 
     def test_initiate_calls_correct_command(self) -> None:
         """Verify initiation uses correct swanctl command (Task 1.1)."""
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
+        mock_runner = Mock(spec=subprocess.run, return_value=_OK_RESULT)
 
         initiate_peer(name="cmd-peer", runner=mock_runner)
+        called_with = [c.args[0] for c in mock_runner.call_args_list]
         # Should call load-all first, then initiate (both in ns_ct namespace)
-        assert called_with[0] == ["ip", "netns", "exec", "ns_ct", "swanctl", "--load-all"]
-        assert called_with[1] == ["ip", "netns", "exec", "ns_ct", "swanctl", "--initiate", "--child", "cmd-peer-child"]
+        assert called_with == [
+            ["ip", "netns", "exec", "ns_ct", "swanctl", "--load-all"],
+            ["ip", "netns", "exec", "ns_ct", "swanctl", "--initiate", "--child", "cmd-peer-child"],
+        ]
 
+    def test_initiate_after_load_all_timeout(self) -> None:
+        """Verify a hung load-all does not consume the initiation timeout."""
+        mock_runner = Mock(spec=subprocess.run, side_effect=[_TIMEOUT_EXC, _OK_RESULT])
 
-class TestTeardownPeer:
-    """Tests for tunnel teardown (Story 4.3, Task 3)."""
+        result = initiate_peer(name="cmd-peer", runner=mock_runner)
+        assert result["status"] == "success"
+        assert result["warning"] == "swanctl --load-all timed out"
+        assert mock_runner.call_args.kwargs["timeout"] == 5
 
-    def test_teardown_success(self) -> None:
-        """Verify successful teardown returns success."""
-        def mock_runner(*args, **kwargs):
-            result = subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-            return result
+    def test_initiate_successful_load_all_has_no_warning(self) -> None:
+        """Verify a clean load-all adds no warning to the result."""
+        loaded = subprocess.CompletedProcess(
+            [], 0, stdout="loaded connection 'cmd-peer'\n", stderr=""
+        )
+        mock_runner = Mock(spec=subprocess.run, side_effect=[loaded, _OK_RESULT])
 
-        result = teardown_peer(name="test-peer", runner=mock_runner)
+        result = initiate_peer(name="cmd-peer", runner=mock_runner)
         assert result["status"] == "success"
-        assert "torn down" in result["message"].lower()
+        assert "warning" not in result
 
-    def test_teardown_already_down(self) -> None:
-        """Verify teardown when tunnel is already down returns success."""
-        def mock_runner(*args, **kwargs):
-            result = subprocess.CompletedProcess(
-                args[0], 1, stdout="", stderr="no matching connection"
-            )
-            return result
+    def test_initiate_without_load_runs_initiate_only(self) -> None:
+        """Verify load_conns_first=False runs swanctl --initiate directly."""
+        mock_runner = Mock(spec=subprocess.run, return_value=_OK_RESULT)
 
-        result = teardown_peer(name="down-peer", runner=mock_runner)
-        assert result["status"] == "success"
+        initiate_peer(name="cmd-peer", runner=mock_runner, load_conns_first=False)
+        mock_runner.assert_called_once()
+        assert mock_runner.call_args.args[0] == [
+            "ip", "netns", "exec", "ns_ct", "swanctl", "--initiate", "--child", "cmd-peer-child"
+        ]
 
-    def test_teardown_timeout(self) -> None:
-        """Verify teardown handles timeout gracefully."""
-        def mock_runner(*args, **kwargs):
-            raise subprocess.TimeoutExpired(cmd="swanctl", timeout=5)
 
-        result = teardown_peer(name="timeout-peer", runner=mock_runner)
-        assert result["status"] == "success"
-        assert "timed out" in result["message"].lower()
+class TestTeardownPeer:
+    """Tests for tunnel teardown (Story 4.3, Task 3)."""
 
-    def test_teardown_swanctl_not_found(self) -> None:
-        """Verify teardown handles missing swanctl gracefully."""
-        def mock_runner(*args, **kwargs):
-            raise FileNotFoundError("swanctl not found")
+    def test_teardown_already_down(self) -> None:
+        """Verify teardown when tunnel is already down returns success."""
+        mock_runner = Mock(spec=subprocess.run, return_value=_NO_MATCH_RESULT)
 
-        result = teardown_peer(name="nobin-peer", runner=mock_runner)
+        result = teardown_peer(name="down-peer", runner=mock_runner)
         assert result["status"] == "success"
-        assert "not available" in result["message"].lower()
 
 
 class TestRemovePeerConfig:
     """Tests for config file removal (Story 4.3, Task 4)."""
 
-    def test_remove_existing_config(self, tmp_path) -> None:
+    def test_remove_existing_config(self, conf_dir) -> None:
         """Verify removing existing config file succeeds."""
-        config_file = tmp_path / "test-peer.conf"
+        config_file = conf_dir / "test-peer.conf"
         config_file.write_text("connections { }")
 
-        result = remove_peer_config(name="test-peer", conf_dir=str(tmp_path))
+        result = remove_peer_config(name="test-peer", conf_dir=str(conf_dir))
         assert result["status"] == "success"
         assert "removed" in result["message"].lower()
         assert not config_file.exists()
 
-    def test_remove_nonexistent_config_idempotent(self, tmp_path) -> None:
+    def test_remove_nonexistent_config_idempotent(self, conf_dir) -> None:
         """Verify removing non-existent config file is idempotent."""
-        result = remove_peer_config(name="missing-peer", conf_dir=str(tmp_path))
+        result = remove_peer_config(name="missing-peer", conf_dir=str(conf_dir))
         assert result["status"] == "success"
         assert "already removed" in result["message"].lower()
 
-    def test_remove_config_returns_path_in_message(self, tmp_path) -> None:
+    def test_remove_config_returns_path_in_message(self, conf_dir) -> None:
         """Verify removal message contains file path."""
-        config_file = tmp_path / "path-peer.conf"
+        config_file = conf_dir / "path-peer.conf"
         config_file.write_text("connections { }")
 
-        result = remove_peer_config(name="path-peer", conf_dir=str(tmp_path))
+        result = remove_peer_config(name="path-peer", conf_dir=str(conf_dir))
         assert "path-peer.conf" in result["message"]
 
-    def test_remove_config_file_permissions_error(self, tmp_path) -> None:
+    def test_remove_config_file_permissions_error(self, non_root_user, conf_dir) -> None:
         """Verify removal handles permission errors."""
-        config_file = tmp_path / "locked-peer.conf"
+        config_file = conf_dir / "locked-peer.conf"
         config_file.write_text("data")
 
         # Make file read-only, and directory read-only too
         config_file.chmod(0o444)
-        tmp_path.chmod(0o555)
-
-        result = remove_peer_config(name="locked-peer", conf_dir=str(tmp_path))
+        conf_dir.chmod(0o555)
 
-        # Restore permissions for cleanup
-        tmp_path.chmod(0o755)
-        config_file.chmod(0o644)
+        result = remove_peer_config(name="locked-peer", conf_dir=str(conf_dir))
 
         assert result["status"] == "error"
         assert "failed" in result["message"].lower()
@@ -365,9 +353,7 @@ class TestRemovePeerConfig:
 class TestWriteRoutesConfig:
     """Tests for write_routes_config (Story 4.4, Task 4)."""
 
-    def test_write_routes_sets_remote_ts(self, tmp_path) -> None:
-        """Verify routes are written as remote_ts in config."""
-        config_content = """# Auto-generated by encryptor-sim daemon
+    SITE_A_CONFIG = """# Auto-generated by encryptor-sim daemon
 connections {
     site-a {
         version = 2
@@ -381,83 +367,73 @@ connections {
     }
 }
 """
-        config_file = tmp_path / "site-a.conf"
-        config_file.write_text(config_content)
 
+    @pytest.fixture
+    def site_a_config(self, conf_dir) -> Path:
+        """Write the site-a peer config the route tests update."""
+        config_file = conf_dir / "site-a.conf"
+        config_file.write_text(self.SITE_A_CONFIG)
+        return config_file
+
+    def test_write_routes_sets_remote_ts(self, conf_dir, site_a_config) -> None:
+        """Verify routes are written as remote_ts in config."""
         routes = [
             {"destination_cidr": "192.168.1.0/24"},
             {"destination_cidr": "10.0.0.0/8"},
         ]
 
         result = write_routes_config(
-            name="site-a", routes=routes, conf_dir=str(tmp_path)
+            name="site-a", routes=routes, conf_dir=str(conf_dir)
         )
 
         assert result["status"] == "success"
-        content = config_file.read_text()
+        content = site_a_config.read_text()
         assert "remote_ts = 192.168.1.0/24,10.0.0.0/8" in content
 
-    def test_write_routes_sets_local_ts_from_pt_subnet(self, tmp_path) -> None:
+    def test_write_routes_sets_local_ts_from_pt_subnet(self, conf_dir, site_a_config) -> None:
         """Verify local_ts is set to the PT subnet when provided."""
-        config_content = """# Auto-generated by encryptor-sim daemon
-connections {
-    site-a {
-        version = 2
-        remote_addrs = 10.1.1.1
-        children {
-            site-a-child {
-                mode = tunnel
-                dpd_action = restart
-            }
-        }
-    }
-}
-"""
-        config_file = tmp_path / "site-a.conf"
-        config_file.write_text(config_content)
-
         routes = [{"destination_cidr": "192.168.1.0/24"}]
 
         result = write_routes_config(
             name="site-a", routes=routes,
             local_subnet="10.0.0.0/24",
-            conf_dir=str(tmp_path),
+            conf_dir=str(conf_dir),
         )
 
         assert result["status"] == "success"
-        content = config_file.read_text()
+        content = site_a_config.read_text()
         assert "local_ts = 10.0.0.0/24" in content
         assert "remote_ts = 192.168.1.0/24" in content
 
-    def test_write_routes_config_file_not_found(self, tmp_path) -> None:
+    def test_write_routes_config_file_not_found(self, conf_dir) -> None:
         """Verify graceful handling when config file doesn't exist."""
         result = write_routes_config(
-            name="nonexistent", routes=[], conf_dir=str(tmp_path)
+            name="nonexistent", routes=[], conf_dir=str(conf_dir)
         )
         assert result["status"] == "success"
         assert "not found" in result["message"].lower()
 
-    def test_write_routes_empty_routes_defaults(self, tmp_path) -> None:
+    def test_write_routes_empty_routes_defaults(self, conf_dir) -> None:
         """Verify empty routes uses 0.0.0.0/0 default for remote_ts."""
-        config_file = tmp_path / "empty-routes.conf"
+        config_file = conf_dir / "empty-routes.conf"
         config_file.write_text("connections {\n    test {\n        children {\n            test-child {\n                mode = tunnel\n            }\n        }\n    }\n}\n")
 
         result = write_routes_config(
-            name="empty-routes", routes=[], conf_dir=str(tmp_path)
+            name="empty-routes", routes=[], conf_dir=str(conf_dir)
         )
 
         assert result["status"] == "success"
         content = config_file.read_text()
         assert "remote_ts = 0.0.0.0/0" in content
 
-    def test_write_routes_updates_existing_remote_ts(self, tmp_path) -> None:
+    def test_write_routes_updates_existing_remote_ts(self, conf_dir) -> None:
         """Verify existing remote_ts is replaced."""
-        config_file = tmp_path / "update-ts.conf"
+        config_file = conf_dir / "update-ts.conf"
         config_file.write_text("connections {\n    test {\n        children {\n            test-child {\n                remote_ts = 192.168.1.0/24\n            }\n        }\n    }\n}\n")
 
         routes = [{"destination_cidr": "10.0.0.0/8"}]
         result = write_routes_config(
-            name="update-ts", routes=routes, conf_dir=str(tmp_path)
+            name="update-ts", routes=routes, conf_dir=str(conf_dir)
         )
 
         assert result["status"] == "success"
@@ -466,51 +442,51 @@ connections {
         assert "192.168.1.0/24" not in content
 
 
-class TestReloadPeerConfig:
-    """Tests for reload_peer_config (Story 4.4, Task 4)."""
+class TestSwanctlOpOutcomes:
+    """Shared success and failure handling of the swanctl peer operations."""
 
-    def test_reload_success(self) -> None:
-        """Verify reload returns success on swanctl success."""
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
+    OPS = pytest.mark.parametrize(
+        "op,missing_status",
+        [(initiate_peer, "warning"), (teardown_peer, "success"), (reload_peer_config, "success")],
+        ids=["initiate", "teardown", "reload"],
+    )
 
-        result = reload_peer_config(name="test-peer", runner=mock_runner)
-        assert result["status"] == "success"
-        assert "reloaded" in result["message"].lower()
-
-    def test_reload_swanctl_not_found(self) -> None:
-        """Verify reload handles missing swanctl."""
-        def mock_runner(*args, **kwargs):
-            raise FileNotFoundError("swanctl not found")
+    @pytest.mark.parametrize(
+        "op,keyword",
+        [(initiate_peer, "initiated"), (teardown_peer, "torn down"), (reload_peer_config, "reloaded")],
+        ids=["initiate", "teardown", "reload"],
+    )
+    def test_success(self, op, keyword) -> None:
+        """Verify a zero exit status is reported as success."""
+        mock_runner = Mock(spec=subprocess.run, return_value=_OK_RESULT)
 
-        result = reload_peer_config(name="test-peer", runner=mock_runner)
+        result = op(name="test-peer", runner=mock_runner)
         assert result["status"] == "success"
-        assert "not available" in result["message"].lower()
+        assert keyword in result["message"].lower()
 
-    def test_reload_timeout(self) -> None:
-        """Verify reload handles timeout."""
-        def mock_runner(*args, **kwargs):
-            raise subprocess.TimeoutExpired(cmd="swanctl", timeout=5)
+    @OPS
+    def test_timeout(self, op, missing_status) -> None:
+        """Verify a swanctl timeout is handled gracefully (AC: #3, Task 1.4)."""
+        mock_runner = Mock(spec=subprocess.run, side_effect=_TIMEOUT_EXC)
 
-        result = reload_peer_config(name="test-peer", runner=mock_runner)
-        assert result["status"] == "success"
+        result = op(name="timeout-peer", runner=mock_runner)
+        assert result["status"] == missing_status
         assert "timed out" in result["message"].lower()
 
+    @OPS
+    def test_swanctl_not_found(self, op, missing_status) -> None:
+        """Verify a missing swanctl is handled gracefully (AC: #3, Task 1.4)."""
+        mock_runner = Mock(spec=subprocess.run, side_effect=_NOT_FOUND_EXC)
+
+        result = op(name="nobin-peer", runner=mock_runner)
+        assert result["status"] == missing_status
+        assert "not available" in result["message"].lower()
+
 
 class TestGetTunnelStatus:
     """Tests for tunnel status query (Story 5.1, Task 1)."""
 
-    @staticmethod
-    def _lookup_peer_ids(names):
-        mapping = {
-            "site-a": 1,
-            "site-b": 2,
-            "peer-x": 3,
-            "gone-peer": 4,
-        }
-        return {name: mapping[name] for name in names if name in mapping}
-
-    def test_returns_established_as_up(self) -> None:
+    def test_returns_established_as_up(self, runner_factory) -> None:
         """Verify ESTABLISHED IKE SA maps to 'up' status (AC: #6)."""
         output = (
             "site-a: #1, ESTABLISHED, IKEv2, "
@@ -520,64 +496,60 @@ class TestGetTunnelStatus:
             "  site-a-child: #1, INSTALLED, TUNNEL\n"
         )
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result[1] == "up"
 
-    def test_returns_connecting_as_negotiating(self) -> None:
+    def test_returns_connecting_as_negotiating(self, runner_factory) -> None:
         """Verify CONNECTING IKE SA maps to 'negotiating' (AC: #6)."""
         output = (
             "site-b: #2, CONNECTING, IKEv2, "
             "00000000_i 00000000_r\n"
         )
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result[2] == "negotiating"
 
-    def test_returns_rekeying_as_negotiating(self) -> None:
+    def test_returns_rekeying_as_negotiating(self, runner_factory) -> None:
         """Verify REKEYING IKE SA maps to 'negotiating' (AC: #6)."""
         output = (
             "peer-x: #3, REKEYING, IKEv2, "
             "aabbccdd_i eeffaabb_r\n"
         )
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result[3] == "negotiating"
 
-    def test_returns_deleting_as_down(self) -> None:
+    def test_returns_deleting_as_down(self, runner_factory) -> None:
         """Verify DELETING IKE SA maps to 'down' (AC: #6)."""
         output = (
             "gone-peer: #4, DELETING, IKEv2, "
             "11223344_i 55667788_r\n"
         )
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result[4] == "down"
 
-    def test_multiple_peers(self) -> None:
+    def test_multiple_peers(self, runner_factory) -> None:
         """Verify multiple peers are parsed correctly (AC: #1)."""
         output = (
             "site-a: #1, ESTABLISHED, IKEv2, "
@@ -589,133 +561,114 @@ class TestGetTunnelStatus:
             "00000000_i 00000000_r\n"
         )
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result[1] == "up"
         assert result[2] == "negotiating"
 
-    def test_empty_output_returns_empty_dict(self) -> None:
+    def test_empty_output_returns_empty_dict(self, runner_factory) -> None:
         """Verify empty swanctl output returns empty dict."""
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
+        mock_runner = runner_factory()
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result == {}
 
     def test_swanctl_not_found_returns_empty_dict(self) -> None:
         """Verify graceful handling when swanctl is not available."""
-        def mock_runner(*args, **kwargs):
-            raise FileNotFoundError("swanctl not found")
+        mock_runner = Mock(spec=subprocess.run, side_effect=_NOT_FOUND_EXC)
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result == {}
 
     def test_swanctl_timeout_returns_empty_dict(self) -> None:
         """Verify graceful handling on timeout."""
-        def mock_runner(*args, **kwargs):
-            raise subprocess.TimeoutExpired(cmd="swanctl", timeout=5)
+        mock_runner = Mock(spec=subprocess.run, side_effect=_TIMEOUT_EXC)
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result == {}
 
-    def test_swanctl_nonzero_exit_returns_empty_dict(self) -> None:
+    def test_swanctl_nonzero_exit_returns_empty_dict(self, runner_factory) -> None:
         """Verify graceful handling on command failure."""
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 1, stdout="", stderr="error")
+        mock_runner = runner_factory(returncode=1, stderr="error")
 
         result = get_tunnel_status(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
         assert result == {}
 
-    def test_calls_swanctl_list_sas(self) -> None:
+    def test_calls_swanctl_list_sas(self, recording_runner) -> None:
         """Verify the correct swanctl command is called."""
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
         get_tunnel_status(
-            runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            runner=recording_runner,
+            peer_id_lookup=_lookup_peer_ids,
         )
-        assert called_with[0] == ["ip", "netns", "exec", "ns_ct", "swanctl", "--list-sas"]
+        assert recording_runner.calls[0] == ["ip", "netns", "exec", "ns_ct", "swanctl", "--list-sas"]
+
+
+# swanctl --list-sas fixtures shared by the telemetry tests
+_OUT_SITE_A_ESTABLISHED_FULL = (
+    "site-a: #1, ESTABLISHED, IKEv2, "
+    "abcdef01_i 12345678_r\n"
+    "  established: 3600 seconds ago\n"
+    "  site-a-child: #1, INSTALLED, TUNNEL\n"
+    "    bytes_in:  1024, bytes_out:  2048\n"
+    "    packets_in:  10, packets_out:  20\n"
+)
+_OUT_SITE_B_ESTABLISHED_BARE = (
+    "site-b: #2, ESTABLISHED, IKEv2, "
+    "00000000_i 00000000_r\n"
+)
+_OUT_PEER_X_CONNECTING = (
+    "peer-x: #3, CONNECTING, IKEv2, "
+    "00000000_i 00000000_r\n"
+)
 
 
 class TestGetTunnelTelemetry:
     """Tests for tunnel telemetry extraction (Story 5.4, Task 1)."""
 
-    @staticmethod
-    def _lookup_peer_ids(names):
-        mapping = {
-            "site-a": 1,
-            "site-b": 2,
-            "peer-x": 3,
-        }
-        return {name: mapping[name] for name in names if name in mapping}
-
-    def test_returns_telemetry_structure_with_status(self) -> None:
+    def test_returns_telemetry_structure_with_status(self, runner_factory) -> None:
         """Verify telemetry includes status field (AC: #1)."""
-        output = (
-            "site-a: #1, ESTABLISHED, IKEv2, "
-            "abcdef01_i 12345678_r\n"
-            "  established: 3600 seconds ago\n"
-            "  site-a-child: #1, INSTALLED, TUNNEL\n"
-            "    bytes_in:  1024, bytes_out:  2048\n"
-            "    packets_in:  10, packets_out:  20\n"
-        )
+        output = _OUT_SITE_A_ESTABLISHED_FULL
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         assert 1 in result
         assert result[1]["status"] == "up"
 
-    def test_returns_established_seconds(self) -> None:
+    def test_returns_established_seconds(self, runner_factory) -> None:
         """Verify telemetry includes establishedSec field (AC: #2)."""
-        output = (
-            "site-a: #1, ESTABLISHED, IKEv2, "
-            "abcdef01_i 12345678_r\n"
-            "  established: 3600 seconds ago\n"
-            "  site-a-child: #1, INSTALLED, TUNNEL\n"
-            "    bytes_in:  1024, bytes_out:  2048\n"
-            "    packets_in:  10, packets_out:  20\n"
-        )
+        output = _OUT_SITE_A_ESTABLISHED_FULL
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         assert result[1]["establishedSec"] == 3600
 
-    def test_returns_traffic_counters(self) -> None:
+    def test_returns_traffic_counters(self, runner_factory) -> None:
         """Verify telemetry includes bytes and packets counters (AC: #3)."""
         output = (
             "site-a: #1, ESTABLISHED, IKEv2, "
@@ -726,13 +679,11 @@ class TestGetTunnelTelemetry:
             "    packets_in:  32, packets_out:  64\n"
         )
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         assert result[1]["bytesIn"] == 4096
@@ -740,20 +691,15 @@ class TestGetTunnelTelemetry:
         assert result[1]["packetsIn"] == 32
         assert result[1]["packetsOut"] == 64
 
-    def test_defaults_safely_when_telemetry_missing(self) -> None:
+    def test_defaults_safely_when_telemetry_missing(self, runner_factory) -> None:
         """Verify telemetry defaults to safe values when fields missing (AC: #8, #3)."""
-        output = (
-            "site-b: #2, ESTABLISHED, IKEv2, "
-            "00000000_i 00000000_r\n"
-        )
+        output = _OUT_SITE_B_ESTABLISHED_BARE
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         assert result[2]["status"] == "up"
@@ -763,50 +709,40 @@ class TestGetTunnelTelemetry:
         assert result[2]["packetsIn"] == 0
         assert result[2]["packetsOut"] == 0
 
-    def test_negotiating_tunnel_has_zero_telemetry(self) -> None:
+    def test_negotiating_tunnel_has_zero_telemetry(self, runner_factory) -> None:
         """Verify negotiating tunnels have zero telemetry values (AC: #3, #8)."""
-        output = (
-            "peer-x: #3, CONNECTING, IKEv2, "
-            "00000000_i 00000000_r\n"
-        )
+        output = _OUT_PEER_X_CONNECTING
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         assert result[3]["status"] == "negotiating"
         assert result[3]["establishedSec"] == 0
         assert result[3]["bytesIn"] == 0
 
-    def test_multiple_peers_with_varying_telemetry(self) -> None:
+    def test_multiple_peers_with_varying_telemetry(self, runner_factory) -> None:
         """Verify parser handles multiple peers with different telemetry states (AC: #10)."""
-        output = (
-            "site-a: #1, ESTABLISHED, IKEv2, "
-            "abcdef01_i 12345678_r\n"
-            "  established: 7200 seconds ago\n"
-            "  site-a-child: #1, INSTALLED, TUNNEL\n"
-            "    bytes_in:  10240, bytes_out:  20480\n"
-            "    packets_in:  100, packets_out:  200\n"
-            "site-b: #2, CONNECTING, IKEv2, "
-            "11223344_i 55667788_r\n"
-            "peer-x: #3, ESTABLISHED, IKEv2, "
-            "aabbccdd_i eeffaabb_r\n"
-            "  established: 300 seconds ago\n"
-            "  peer-x-child: #3, INSTALLED, TUNNEL\n"
-        )
-
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        output = "\n".join((
+            "site-a: #1, ESTABLISHED, IKEv2, abcdef01_i 12345678_r",
+            "  established: 7200 seconds ago",
+            "  site-a-child: #1, INSTALLED, TUNNEL",
+            "    bytes_in:  10240, bytes_out:  20480",
+            "    packets_in:  100, packets_out:  200",
+            "site-b: #2, CONNECTING, IKEv2, 11223344_i 55667788_r",
+            "peer-x: #3, ESTABLISHED, IKEv2, aabbccdd_i eeffaabb_r",
+            "  established: 300 seconds ago",
+            "  peer-x-child: #3, INSTALLED, TUNNEL",
+        )) + "\n"
+
+        mock_runner = runner_factory(output)
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         # site-a has full telemetry
@@ -823,20 +759,18 @@ class TestGetTunnelTelemetry:
         assert result[3]["establishedSec"] == 300
         assert result[3]["bytesIn"] == 0
 
-    def test_swanctl_failure_returns_empty_dict(self) -> None:
+    def test_swanctl_failure_returns_empty_dict(self, runner_factory) -> None:
         """Verify graceful degradation when swanctl fails (AC: #8)."""
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 1, stdout="", stderr="error")
+        mock_runner = runner_factory(returncode=1, stderr="error")
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         assert result == {}
 
-    def test_malformed_output_extracts_what_it_can(self) -> None:
+    def test_malformed_output_extracts_what_it_can(self, runner_factory) -> None:
         """Verify parser extracts available data from malformed output (AC: #8, #10)."""
         output = (
             "site-a: #1, ESTABLISHED, IKEv2, "
@@ -845,13 +779,11 @@ class TestGetTunnelTelemetry:
             "    bytes_in:  invalid, bytes_out:  2048\n"
         )
 
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout=output, stderr="")
+        mock_runner = runner_factory(output)
 
-        from backend.daemon.ops.strongswan_ops import get_tunnel_telemetry
         result = get_tunnel_telemetry(
             runner=mock_runner,
-            peer_id_lookup=self._lookup_peer_ids,
+            peer_id_lookup=_lookup_peer_ids,
         )
 
         # Should still extract status and default invalid fields
@@ -896,47 +828,41 @@ class TestSpacesInPeerName:
         # Original name preserved in comment
         assert "# Peer: Site A" in config
 
-    def test_initiate_uses_sanitized_child_name(self) -> None:
-        """Verify initiation command uses sanitized CHILD_SA name."""
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
-        initiate_peer(name="Site A", runner=mock_runner)
-        assert called_with[0] == ["ip", "netns", "exec", "ns_ct", "swanctl", "--load-all"]
-        assert called_with[1] == ["ip", "netns", "exec", "ns_ct", "swanctl", "--initiate", "--child", "Site_A-child"]
-
-    def test_teardown_uses_sanitized_child_name(self) -> None:
-        """Verify teardown command uses sanitized CHILD_SA name."""
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
-        teardown_peer(name="Site A", runner=mock_runner)
-        assert called_with[0] == ["ip", "netns", "exec", "ns_ct", "swanctl", "--terminate", "--child", "Site_A-child"]
-
-    def test_configure_peer_writes_sanitized_filename(self, tmp_path) -> None:
+    @pytest.mark.parametrize(
+        "op,expected_tail",
+        [
+            (initiate_peer, ["swanctl", "--initiate", "--child", "Site_A-child"]),
+            (teardown_peer, ["swanctl", "--terminate", "--child", "Site_A-child"]),
+        ],
+        ids=["initiate", "teardown"],
+    )
+    def test_child_commands_use_sanitized_name(self, op, expected_tail) -> None:
+        """Verify swanctl child commands use the sanitized CHILD_SA name."""
+        mock_runner = Mock(spec=subprocess.run, return_value=_OK_RESULT)
+
+        op(name="Site A", runner=mock_runner)
+        cmd = mock_runner.call_args.args[0]
+        assert cmd[:4] == ["ip", "netns", "exec", "ns_ct"]
+        assert cmd[-len(expected_tail):] == expected_tail
+
+    def test_configure_peer_writes_sanitized_filename(self, conf_dir) -> None:
         """Verify config file uses sanitized name."""
         result = configure_peer(
             name="Site A",
             remote_ip="10.1.1.1",
             psk="secret",
             ike_version="ikev2",
-            conf_dir=str(tmp_path),
+            conf_dir=str(conf_dir),
         )
         assert result["status"] == "success"
-        assert (tmp_path / "Site_A.conf").exists()
-        assert not (tmp_path / "Site A.conf").exists()
+        assert (conf_dir / "Site_A.conf").exists()
+        assert not (conf_dir / "Site A.conf").exists()
 
-    def test_remove_peer_config_uses_sanitized_filename(self, tmp_path) -> None:
+    def test_remove_peer_config_uses_sanitized_filename(self, conf_dir) -> None:
         """Verify config removal uses sanitized filename."""
-        config_file = tmp_path / "Site_A.conf"
+        config_file = conf_dir / "Site_A.conf"
         config_file.write_text("connections { }")
 
-        result = remove_peer_config(name="Site A", conf_dir=str(tmp_path))
+        result = remove_peer_config(name="Site A", conf_dir=str(conf_dir))
         assert result["status"] == "success"
         assert not config_file.exists()
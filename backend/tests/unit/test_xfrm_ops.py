@@ -1,10 +1,9 @@
 """Unit tests for XFRM interface operations."""
 
-import os
 import subprocess
+from unittest.mock import Mock
 
-os.environ.setdefault("APP_PSK_ENCRYPTION_KEY", "test-key-for-testing-32bytes1")
-os.environ.setdefault("APP_SECRET_KEY", "test-secret-key-for-jwt-testing")
+import pytest
 
 from backend.daemon.ops.xfrm_ops import (
     _if_id_from_peer_id,
@@ -17,6 +16,8 @@ from backend.daemon.ops.xfrm_ops import (
     remove_tunnel_routes,
 )
 
+_OK_RESULT = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+
 
 class TestHelpers:
     """Tests for helper functions."""
@@ -33,92 +34,61 @@ class TestHelpers:
 class TestCreateXfrmInterface:
     """Tests for XFRM interface creation."""
 
-    def test_creates_interface_with_correct_commands(self) -> None:
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
-        result = create_xfrm_interface(1, 1, runner=mock_runner)
+    def test_creates_interface_with_correct_commands(self, recording_runner) -> None:
+        result = create_xfrm_interface(1, 1, runner=recording_runner)
+        called_with = recording_runner.calls
 
         assert result == "xfrm1"
         # First call: delete existing (idempotent cleanup)
         assert called_with[0] == ["ip", "link", "del", "xfrm1"]
-        # Second call: create xfrmi inside ns_ct linked to eth1
-        assert called_with[1] == [
-            "ip", "netns", "exec", "ns_ct",
-            "ip", "link", "add", "xfrm1",
-            "type", "xfrm",
-            "dev", "eth1",
-            "if_id", "1",
-        ]
-        # Third call: move xfrmi from ns_ct to default namespace (PID 1)
-        assert called_with[2] == [
-            "ip", "netns", "exec", "ns_ct",
-            "ip", "link", "set", "xfrm1", "netns", "1",
-        ]
-        # Fourth call: set MTU
-        assert called_with[3] == ["ip", "link", "set", "xfrm1", "mtu", "1400"]
-        # Fifth call: bring up
-        assert called_with[4] == ["ip", "link", "set", "xfrm1", "up"]
-
-    def test_uses_peer_id_for_naming(self) -> None:
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
+        # Second call: create xfrmi inside ns_ct linked to eth1, then move it
+        # to the default namespace (PID 1)
+        assert called_with[1] == ["ip", "netns", "exec", "ns_ct", "ip", "-batch", "-"]
+        assert recording_runner.call_kwargs[1]["input"] == (
+            "link add xfrm1 type xfrm dev eth1 if_id 1\n"
+            "link set xfrm1 netns 1\n"
+        )
+        # Third call: set MTU and bring up
+        assert called_with[2] == ["ip", "-batch", "-"]
+        assert recording_runner.call_kwargs[2]["input"] == (
+            "link set xfrm1 mtu 1400\n"
+            "link set xfrm1 up\n"
+        )
+        assert len(called_with) == 3
 
-        result = create_xfrm_interface(42, 42, runner=mock_runner)
+    def test_uses_peer_id_for_naming(self, recording_runner) -> None:
+        result = create_xfrm_interface(42, 42, runner=recording_runner)
         assert result == "xfrm42"
 
     def test_raises_on_create_failure(self) -> None:
-        call_count = [0]
-
-        def mock_runner(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 2:  # The create command
-                raise subprocess.CalledProcessError(1, "ip")
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
+        # The second call is the create command
+        mock_runner = Mock(
+            spec=subprocess.run,
+            side_effect=[_OK_RESULT, subprocess.CalledProcessError(1, "ip")],
+        )
 
-        try:
+        with pytest.raises(subprocess.CalledProcessError):
             create_xfrm_interface(1, 1, runner=mock_runner)
-            assert False, "Should have raised"
-        except subprocess.CalledProcessError:
-            pass
 
 
 class TestDeleteXfrmInterface:
     """Tests for XFRM interface deletion."""
 
-    def test_deletes_interface(self) -> None:
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
-        delete_xfrm_interface(1, runner=mock_runner)
-        assert called_with[0] == ["ip", "link", "del", "xfrm1"]
-
-    def test_idempotent_when_not_found(self) -> None:
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 1, stdout="", stderr="not found")
+    def test_deletes_interface(self, recording_runner) -> None:
+        delete_xfrm_interface(1, runner=recording_runner)
+        assert recording_runner.calls[0] == ["ip", "link", "del", "xfrm1"]
 
+    def test_idempotent_when_not_found(self, runner_factory) -> None:
         # Should not raise
-        delete_xfrm_interface(99, runner=mock_runner)
+        delete_xfrm_interface(99, runner=runner_factory(returncode=1, stderr="not found"))
 
 
 class TestAddTunnelRoute:
     """Tests for tunnel route management."""
 
-    def test_adds_route_with_correct_command(self) -> None:
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
-        add_tunnel_route(1, "192.168.1.0/24", runner=mock_runner)
-        assert called_with[0] == [
+    def test_adds_route_with_correct_command(self, recording_runner) -> None:
+        add_tunnel_route(1, "192.168.1.0/24", runner=recording_runner)
+        assert recording_runner.calls[0] == [
             "ip", "route", "replace", "192.168.1.0/24", "dev", "xfrm1",
         ]
 
@@ -126,69 +96,63 @@ class TestAddTunnelRoute:
 class TestRemoveTunnelRoutes:
     """Tests for tunnel route removal."""
 
-    def test_removes_routes_for_device(self) -> None:
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            if args[0][:3] == ["ip", "route", "show"]:
-                return subprocess.CompletedProcess(
-                    args[0], 0,
-                    stdout="192.168.1.0/24 dev xfrm1\n10.0.0.0/8 dev xfrm1\n",
-                    stderr="",
-                )
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
+    def test_removes_routes_in_one_batch(self, runner_factory) -> None:
+        mock_runner = runner_factory(
+            stdout_map={
+                ("ip", "-j", "route", "show"): (
+                    '[{"dst":"192.168.1.0/24","dev":"xfrm1"},'
+                    '{"dst":"10.0.0.0/8","dev":"xfrm1"}]'
+                ),
+            }
+        )
 
         remove_tunnel_routes(1, runner=mock_runner)
-        # Should have called show, then two deletes
-        assert len(called_with) == 3
-        assert called_with[1] == ["ip", "route", "del", "192.168.1.0/24", "dev", "xfrm1"]
-        assert called_with[2] == ["ip", "route", "del", "10.0.0.0/8", "dev", "xfrm1"]
-
-    def test_no_op_when_no_routes(self) -> None:
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
+        # One show command, then a single batched delete
+        assert len(mock_runner.calls) == 2
+        assert mock_runner.calls[1] == ["ip", "-force", "-batch", "-"]
+        assert mock_runner.call_kwargs[1]["input"] == (
+            "route del 192.168.1.0/24 dev xfrm1\n"
+            "route del 10.0.0.0/8 dev xfrm1\n"
+        )
+
+    @pytest.mark.parametrize(
+        "stdout, returncode",
+        [
+            ("", 0),
+            ("[]\n", 0),
+            ("192.168.1.0/24 dev xfrm1\n", 0),
+            ('[{"dev":"xfrm1"}]', 0),
+            ("", 1),
+        ],
+        ids=["empty", "empty-json", "not-json", "no-dst", "device-gone"],
+    )
+    def test_no_op_when_no_routes(self, runner_factory, stdout, returncode) -> None:
+        mock_runner = runner_factory(stdout, returncode=returncode)
 
         remove_tunnel_routes(1, runner=mock_runner)
         # Only the show command
-        assert len(called_with) == 1
+        assert mock_runner.calls == [["ip", "-j", "route", "show", "dev", "xfrm1"]]
 
 
 class TestPtReturnRoutes:
     """Tests for ns_pt return route management."""
 
-    def test_add_pt_return_route(self) -> None:
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
-        add_pt_return_route("192.168.1.0/24", runner=mock_runner)
-        assert called_with[0] == [
+    def test_add_pt_return_route(self, recording_runner) -> None:
+        add_pt_return_route("192.168.1.0/24", runner=recording_runner)
+        assert recording_runner.calls[0] == [
             "ip", "netns", "exec", "ns_pt",
             "ip", "route", "replace", "192.168.1.0/24", "via", "169.254.0.1",
         ]
 
-    def test_remove_pt_return_route(self) -> None:
-        called_with = []
-
-        def mock_runner(*args, **kwargs):
-            called_with.append(args[0])
-            return subprocess.CompletedProcess(args[0], 0, stdout="", stderr="")
-
-        remove_pt_return_route("192.168.1.0/24", runner=mock_runner)
-        assert called_with[0] == [
+    def test_remove_pt_return_route(self, recording_runner) -> None:
+        remove_pt_return_route("192.168.1.0/24", runner=recording_runner)
+        assert recording_runner.calls[0] == [
             "ip", "netns", "exec", "ns_pt",
             "ip", "route", "del", "192.168.1.0/24", "via", "169.254.0.1",
         ]
 
-    def test_remove_pt_return_route_idempotent(self) -> None:
-        def mock_runner(*args, **kwargs):
-            return subprocess.CompletedProcess(args[0], 2, stdout="", stderr="not found")
-
+    def test_remove_pt_return_route_idempotent(self, runner_factory) -> None:
         # Should not raise
-        remove_pt_return_route("10.0.0.0/8", runner=mock_runner)
+        remove_pt_return_route(
+            "10.0.0.0/8", runner=runner_factory(returncode=2, stderr="not found")
+        )
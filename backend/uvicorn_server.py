@@ -1,20 +1,32 @@
 import os
 import ssl
+import sys
 
 import uvicorn
 
 
+def _check_tls_floor() -> None:
+    # uvicorn builds ssl.SSLContext(ssl_version) itself and accepts no context,
+    # so the TLS 1.2 floor is the PROTOCOL_TLS_SERVER default (Python 3.10+).
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    if context.minimum_version < ssl.TLSVersion.TLSv1_2:
+        sys.exit("PROTOCOL_TLS_SERVER allows protocols below TLS 1.2; refusing to start")
+
+
 def main() -> None:
     ssl_certfile = os.environ.get("APP_SSL_CERTFILE", "/etc/encryptor-sim/tls/server.crt")
     ssl_keyfile = os.environ.get("APP_SSL_KEYFILE", "/etc/encryptor-sim/tls/server.key")
 
+    _check_tls_floor()
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=443,
         ssl_keyfile=ssl_keyfile,
         ssl_certfile=ssl_certfile,
-        ssl_version=ssl.PROTOCOL_TLSv1_2,
+        ssl_version=ssl.PROTOCOL_TLS_SERVER,
+        loop="uvloop",
+        http="httptools",
     )
 
 
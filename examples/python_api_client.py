@@ -11,16 +11,30 @@ Requirements:
 """
 
 import argparse
+import base64
+import json
 import sys
 import time
 from typing import Optional
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Suppress InsecureRequestWarning for self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Refresh slightly before the server-side expiry to allow for clock skew
+TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
+
+def _jwt_exp(token: str) -> float:
+    """Return the 'exp' claim of a JWT without verifying its signature."""
+    segment = token.split(".")[1]
+    payload = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    return float(payload["exp"])
+
 
 class EncryptorSimClient:
     """API client for Encryptor Simulator automation."""
@@ -35,70 +49,75 @@ class EncryptorSimClient:
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
         self.token_expires_at: float = 0.0
+        # Reuse TCP/TLS connections across calls instead of reconnecting, and
+        # retry transient gateway errors (e.g. during an API restart) in place
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET", "POST"),
+            # Hand the last response back so raise_for_status() reports it
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.verify = verify_ssl
+        self.session.mount(
+            "https://",
+            HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=16),
+        )
 
     def login(self) -> None:
         """Authenticate and store JWT tokens."""
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/v1/auth/login",
             json={"username": self.username, "password": self.password},
-            verify=self.verify_ssl,
         )
         response.raise_for_status()
         data = response.json()["data"]
-        self.access_token = data["accessToken"]
+        self._set_access_token(data["accessToken"])
         self.refresh_token = data["refreshToken"]
-        # Note: Hardcoded 3500s (58min) to refresh before 1-hour expiry.
-        # Production code should decode JWT and read 'exp' claim instead.
-        self.token_expires_at = time.time() + 3500
         print(f"Authenticated as {self.username}")
 
     def refresh_access_token(self) -> None:
         """Get a new access token using the refresh token."""
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/v1/auth/refresh",
             json={"refreshToken": self.refresh_token},
-            verify=self.verify_ssl,
         )
         response.raise_for_status()
         data = response.json()["data"]
-        self.access_token = data["accessToken"]
-        # Note: Hardcoded expiry; production should decode JWT 'exp' claim
-        self.token_expires_at = time.time() + 3500
+        self._set_access_token(data["accessToken"])
         print("Access token refreshed")
 
+    def _set_access_token(self, token: str) -> None:
+        """Store the access token and send it on every session request."""
+        self.access_token = token
+        self.token_expires_at = _jwt_exp(token) - TOKEN_EXPIRY_MARGIN_SECONDS
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
     def _ensure_valid_token(self) -> None:
         """Refresh the access token if it has expired."""
-        if not self.access_token or time.time() >= self.token_expires_at:
-            if self.refresh_token:
-                try:
-                    self.refresh_access_token()
-                    return
-                except requests.HTTPError:
-                    pass
-            self.login()
-
-    def _headers(self) -> dict:
-        """Return Authorization headers."""
-        self._ensure_valid_token()
-        return {"Authorization": f"Bearer {self.access_token}"}
+        if self.access_token and time.time() < self.token_expires_at:
+            return
+        if self.refresh_token:
+            try:
+                self.refresh_access_token()
+                return
+            except requests.HTTPError:
+                pass
+        self.login()
 
     def get_me(self) -> dict:
         """Get current user profile."""
-        response = requests.get(
-            f"{self.base_url}/api/v1/auth/me",
-            headers=self._headers(),
-            verify=self.verify_ssl,
-        )
+        self._ensure_valid_token()
+        response = self.session.get(f"{self.base_url}/api/v1/auth/me")
         response.raise_for_status()
         return response.json()["data"]
 
     def get_health(self) -> dict:
         """Get system health status."""
-        response = requests.get(
-            f"{self.base_url}/api/v1/system/health",
-            headers=self._headers(),
-            verify=self.verify_ssl,
-        )
+        self._ensure_valid_token()
+        response = self.session.get(f"{self.base_url}/api/v1/system/health")
         response.raise_for_status()
         return response.json()["data"]
 
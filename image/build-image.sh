@@ -275,6 +275,7 @@ EOF
         strongswan \
         strongswan-openrc \
         nftables \
+        py3-nftables \
         iproute2 \
         dhcpcd \
         ripgrep \